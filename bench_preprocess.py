@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Benchmark pdf_loader preprocessing and report machine-readable JSON.
+
+Runs preprocessing over the PDFs in ``pdfs/`` (and optional synthetic PDFs)
+for every combination of DPI, worker count and OCR setting. Each run starts
+from an empty project in a fresh interpreter so caches, the manifest and peak
+RSS of earlier runs do not leak into the next one.
+
+Example::
+
+    python bench_preprocess.py --dpi 72 144 --workers 1 4 --synthetic 50 --output bench.json
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+def make_synthetic_pdf(path: str, n_pages: int) -> str:
+    """Write an ESG-report-like PDF: headings, prose and a numeric table per page."""
+    import fitz
+
+    doc = fitz.open()
+    for i in range(1, n_pages + 1):
+        page = doc.new_page()
+        page.insert_text((56, 60), f"Environmental performance {i}", fontsize=16)
+        y = 90
+        for line in range(12):
+            page.insert_text((56, y), f"Scope {line % 3 + 1} greenhouse gas emissions were reduced through energy efficiency.", fontsize=9)
+            y += 13
+        for row in range(15):
+            x = 56
+            for col, value in enumerate((f"Item {row}", "tCO2e", f"{1000 + 37 * row:,}", f"{900 + 31 * row:,}", f"{row * 1.7:.1f}%")):
+                page.insert_text((x, y), value, fontsize=8)
+                page.draw_rect(fitz.Rect(x - 2, y - 9, x + 90, y + 3), color=(0.6, 0.6, 0.6), width=0.3)
+                x += 95
+            y += 14
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _dir_bytes(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+def _peak_rss_mb() -> Dict[str, float | None]:
+    """Peak RSS in MiB of this process and of its largest (finished) worker.
+
+    ``getrusage`` only reports the largest single child, not the sum, so
+    with several workers the total peak lies between ``peak_rss_mb`` +
+    ``worker_peak_rss_mb`` and ``peak_rss_mb`` + workers x
+    ``worker_peak_rss_mb``.
+    """
+    if resource is None:
+        return {"peak_rss_mb": None, "worker_peak_rss_mb": None}
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divisor, 1),
+        "worker_peak_rss_mb": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / divisor, 1),
+    }
+
+
+def _run_once(pdf_path: str, dpi: int, workers: int, ocr: bool) -> Dict:
+    """Preprocess ``pdf_path`` into a temporary project and measure it.
+
+    Executed in a fresh interpreter (see :func:`run_benchmark`).
+    """
+    import pdf_loader
+
+    project_dir = tempfile.mkdtemp(prefix="bench_")
+    try:
+        start = time.perf_counter()
+        pages = pdf_loader.preprocess_pdf(pdf_path, project_dir, ocr=ocr, workers=workers, dpi=dpi, zoom_dpi=2 * dpi)
+        seconds = time.perf_counter() - start
+        n_pages = len(pages)
+        written = _dir_bytes(project_dir)
+    finally:
+        shutil.rmtree(project_dir, ignore_errors=True)
+    return {
+        # preprocess_pdf silently skips OCR without pytesseract.
+        "ocr": bool(ocr and pdf_loader.pytesseract is not None),
+        "pages": n_pages,
+        "seconds": round(seconds, 3),
+        "pages_per_sec": round(n_pages / seconds, 2) if seconds else None,
+        "bytes_written": written,
+        "bytes_per_page": written // n_pages if n_pages else 0,
+        **_peak_rss_mb(),
+    }
+
+
+def run_benchmark(
+    pdf_paths: List[str], dpis: List[int], workers: List[int], ocr_modes: List[bool], repeat: int = 1
+) -> Dict:
+    """Run every configuration and return the JSON-serializable report."""
+    results = []
+    ctx = multiprocessing.get_context("spawn")
+    for pdf_path, dpi, n_workers, ocr in itertools.product(pdf_paths, dpis, workers, ocr_modes):
+        for run in range(repeat):
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                stats = pool.submit(_run_once, pdf_path, dpi, n_workers, ocr).result()
+            results.append(
+                {
+                    "pdf": os.path.basename(pdf_path),
+                    "dpi": dpi,
+                    "workers": n_workers,
+                    "ocr_requested": ocr,
+                    "run": run,
+                    **stats,
+                }
+            )
+            print(
+                f"{results[-1]['pdf']}: dpi={dpi} workers={n_workers} ocr={stats['ocr']} "
+                f"-> {stats['pages_per_sec']} pages/s",
+                file=sys.stderr,
+            )
+    return {
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark PDF preprocessing")
+    parser.add_argument("--pdf_dir", default="pdfs", help="directory of PDFs to benchmark ('' to skip)")
+    parser.add_argument("--synthetic", type=int, nargs="*", default=[], help="page counts of synthetic PDFs to add")
+    parser.add_argument("--dpi", type=int, nargs="+", default=[72])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1], help="worker counts (0 = all CPUs)")
+    parser.add_argument("--ocr", choices=["off", "on", "both"], default="off")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    # PyMuPDF prints notices (deprecations, layout hints) to stdout, also in
+    # worker processes. Point fd 1 at stderr for the whole run, inherited by
+    # every child, and keep the original stdout for the JSON report only.
+    sys.stdout.flush()
+    report_out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+
+    pdf_paths = []
+    if args.pdf_dir and os.path.isdir(args.pdf_dir):
+        pdf_paths = sorted(
+            os.path.join(args.pdf_dir, f) for f in os.listdir(args.pdf_dir) if f.lower().endswith(".pdf")
+        )
+    synthetic_dir = tempfile.mkdtemp(prefix="bench_pdfs_")
+    try:
+        for n in args.synthetic:
+            pdf_paths.append(make_synthetic_pdf(os.path.join(synthetic_dir, f"synthetic_{n}.pdf"), n))
+        if not pdf_paths:
+            print("No PDFs to benchmark", file=sys.stderr)
+            return 1
+        workers = [w if w > 0 else (os.cpu_count() or 1) for w in args.workers]
+        ocr_modes = {"off": [False], "on": [True], "both": [False, True]}[args.ocr]
+        report = run_benchmark(pdf_paths, args.dpi, workers, ocr_modes, args.repeat)
+    finally:
+        shutil.rmtree(synthetic_dir, ignore_errors=True)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        report_out.write(text + "\n")
+    report_out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
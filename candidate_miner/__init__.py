@@ -1,28 +1,126 @@
 """Candidate mining package providing heuristics and LLM helpers."""
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, Iterable, List, Tuple
 
 from .heuristics import heuristic_candidates
-from .llm_miner import llm_candidates
+from .keyword_automaton import KeywordAutomaton
+from .keyword_packs import compile_keywords, normalize_keywords, project_keywords_or_synonyms
+from .llm_cache import LLMCache
+from .llm_miner import LLMClient, llm_batch_metrics, llm_candidates, llm_configured, llm_page_candidates, mine_llm
 
 
 class CandidateMiner:
-    def __init__(self, config: Dict | None = None):
+    def __init__(self, config: Dict | None = None, project_dir: str | None = None):
         self.config = config or {}
+        self.project_dir = project_dir
+        self._client: LLMClient | None = None
+        self._metric_keywords: Dict[str, List[str]] | None = None
+        self._automaton: KeywordAutomaton | None = None
+        self._cache: LLMCache | None = None
 
-    def heuristic(self, metric_id: str, page_meta: Dict) -> List[Dict]:
-        return heuristic_candidates(metric_id, page_meta)
+    @property
+    def client(self) -> LLMClient:
+        """Pooled keep-alive session shared by all LLM calls of this miner."""
+        if self._client is None:
+            self._client = LLMClient(self.config)
+        return self._client
+
+    @property
+    def cache(self) -> LLMCache | None:
+        """Per-project LLM response cache, opened on first LLM use.
+
+        ``None`` without a project, without a configured endpoint or with
+        ``config["llm_cache"]`` false, so heuristic-only sessions leave no
+        cache file behind.
+        """
+        if (
+            self._cache is None
+            and self.project_dir
+            and self.config.get("llm_cache", True)
+            and llm_configured(self.config)
+        ):
+            self._cache = LLMCache.for_project(self.project_dir, self.config)
+        return self._cache
+
+    @property
+    def metric_keywords(self) -> Dict[str, List[str]]:
+        """``{metric_id: [keyword, ...]}`` of the project (``utils.METRIC_SYNONYMS`` without one)."""
+        if self._metric_keywords is None:
+            self._metric_keywords = project_keywords_or_synonyms(self.project_dir)
+        return self._metric_keywords
+
+    @property
+    def automaton(self) -> KeywordAutomaton:
+        """Keyword matcher of the project, the one ``candidates.json`` is mined with."""
+        if self._automaton is None:
+            self._automaton = compile_keywords(normalize_keywords(self.metric_keywords))
+        return self._automaton
+
+    def _with_keywords(self, metric: Dict) -> Dict:
+        """``metric`` with its project keywords, which anchor the windowed page text."""
+        if metric.get("keywords") or not self.config.get("llm_context_tokens"):
+            return metric
+        return {**metric, "keywords": self.metric_keywords.get(metric.get("metric_code", ""), [])}
+
+    def llm_stats(self) -> Dict:
+        """Counters of :attr:`client` (see ``LLMClient.stats``), plus ``cache`` ones."""
+        stats = self.client.stats()
+        if self._cache is not None:
+            stats["cache"] = self._cache.stats()
+        return stats
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    def heuristic(self, metric_id: str, page_meta: Dict, pages_dir: str | None = None) -> List[Dict]:
+        return heuristic_candidates(metric_id, page_meta, pages_dir, self.automaton)
+
+    def heuristic_project(self, project_dir: str, workers: int = 1, write: bool = True):
+        """Mine every metric on every page of a project.
+
+        Returns a ``batch.ProjectCandidates``; see ``batch.mine_project``.
+        """
+        # Imported here so ``python -m candidate_miner.batch`` runs cleanly.
+        from .batch import mine_project
+
+        return mine_project(project_dir, workers=workers, write=write)
 
     def llm(self, metric: Dict, page_text: str) -> List[Dict]:
         """Return candidates from external LLM."""
-        return llm_candidates(metric, page_text, self.config)
+        return llm_candidates(self._with_keywords(metric), page_text, self.config, self.client, self.cache)
+
+    def llm_page(self, metrics: List[Dict], page_text: str) -> List[List[Dict]]:
+        """Return LLM candidates of several metrics on one page, one list per metric."""
+        metrics = [self._with_keywords(metric) for metric in metrics]
+        return llm_page_candidates(metrics, page_text, self.config, self.client, self.cache)
+
+    def llm_many(self, jobs: Iterable[Tuple[Dict, str]], concurrency: int | None = None) -> List[List[Dict]]:
+        """Return LLM candidates for many ``(metric, page_text)`` jobs, in order.
+
+        Jobs on the same page are asked together, up to
+        ``config["llm_batch_metrics"]`` metrics per request. Requests run
+        concurrently, at most ``concurrency`` (default
+        ``config["llm_concurrency"]``, the size of the connection pool) at a
+        time.
+        """
+        jobs = [(self._with_keywords(metric), page_text) for metric, page_text in jobs]
+        return mine_llm(
+            jobs, self.config, concurrency, self.client, self.cache, llm_batch_metrics(self.config)
+        )
 
-    def combined(self, metric_id: str, metric: Dict, page_meta: Dict) -> List[Dict]:
+    def combined(
+        self, metric_id: str, metric: Dict, page_meta: Dict, pages_dir: str | None = None
+    ) -> List[Dict]:
         """Merge heuristic and LLM candidates sorted by score."""
         results = []
-        for h in heuristic_candidates(metric_id, page_meta):
+        for h in self.heuristic(metric_id, page_meta, pages_dir):
             h.setdefault("score", 0.5)
             results.append(h)
-        results.extend(llm_candidates(metric, page_meta.get("text", ""), self.config))
+        results.extend(self.llm(metric, page_meta.get("text", "")))
         return sorted(results, key=lambda x: x.get("score", 0), reverse=True)
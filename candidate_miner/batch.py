@@ -0,0 +1,197 @@
+"""Heuristic candidates for every metric and page of a project in one pass.
+
+Each page is scanned once by a keyword automaton over all metrics (which
+metrics the page is about) and once for numbers (the candidates). Number
+candidates do not depend on the metric, so they are stored once per page in
+``candidates.json`` together with each metric's page list; table cells
+matching a metric's keywords (pages preprocessed with ``tables``) are stored
+per metric::
+
+    {"metric_pages": {metric_id: [page, ...]},
+     "page_candidates": {"<page>": [candidate, ...]},
+     "table_candidates": {"<page>": {metric_id: [candidate, ...]}},
+     "fingerprint": "<sha256>",
+     "summary": {...}}
+
+``fingerprint`` hashes the preprocessing manifest and the keywords the file
+was mined with; :func:`load_candidates` ignores a file whose fingerprint no
+longer matches the project.
+
+Usage::
+
+    python -m candidate_miner.batch --project projects/samsung_2024 --workers 4
+    python -m candidate_miner.batch --all projects
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from page_store import open_page_store, project_dirs
+from pdf_loader import load_manifest, page_ranges
+from utils import read_json, write_json
+
+from .heuristics import merge_candidates, metric_keywords, number_candidates, page_metrics, table_candidates
+from .keyword_automaton import KeywordAutomaton
+from .keyword_packs import compile_keywords, normalize_keywords, project_keywords_or_synonyms
+
+CANDIDATES_NAME = "candidates.json"
+
+
+class ProjectCandidates:
+    """Precomputed heuristic candidates of a project."""
+
+    def __init__(self, data: Dict):
+        self.data = data
+        self._pages = {m: set(pages) for m, pages in data["metric_pages"].items()}
+
+    @property
+    def metric_ids(self) -> List[str]:
+        return list(self.data["metric_pages"])
+
+    def pages(self, metric_id: str) -> List[int]:
+        return self.data["metric_pages"].get(metric_id, [])
+
+    def get(self, metric_id: str, page: int) -> List[Dict]:
+        """Candidates of ``metric_id`` on ``page``, same shape as ``heuristic_candidates``."""
+        if page not in self._pages.get(metric_id, ()):
+            return []
+        tables = self.data.get("table_candidates", {}).get(str(page), {}).get(metric_id, [])
+        return copy.deepcopy(merge_candidates(tables, self.data["page_candidates"].get(str(page), [])))
+
+
+def mine_pages(automaton: KeywordAutomaton, pages: Iterable[Dict], pages_dir: Optional[str] = None) -> Dict:
+    """Mine ``pages``; returns ``metric_pages``, ``page_candidates`` and ``table_candidates``.
+
+    ``automaton`` is compiled from normalized keywords (see
+    ``heuristics.page_metrics``). With ``pages_dir`` candidates carry
+    word-geometry boxes.
+    """
+    metric_pages: Dict[str, List[int]] = {m: [] for m in automaton.metric_ids}
+    page_candidates: Dict[str, List[Dict]] = {}
+    table_candidates_: Dict[str, Dict[str, List[Dict]]] = {}
+    for page in pages:
+        metrics = page_metrics(automaton, page)
+        if not metrics:
+            continue
+        candidates = number_candidates(page, pages_dir)
+        if not candidates:
+            continue
+        for metric_id in metrics:
+            metric_pages[metric_id].append(page["page"])
+            cells = table_candidates(metric_keywords(automaton, metric_id), page, pages_dir) if pages_dir else []
+            if cells:
+                table_candidates_.setdefault(str(page["page"]), {})[metric_id] = cells
+        page_candidates[str(page["page"])] = candidates
+    return {"metric_pages": metric_pages, "page_candidates": page_candidates, "table_candidates": table_candidates_}
+
+
+def _mine_range(pages_dir: str, start: int, stop: int, automaton: KeywordAutomaton) -> Dict:
+    return mine_pages(automaton, open_page_store(pages_dir)[start:stop], pages_dir)
+
+
+def candidates_fingerprint(project_dir: str, metric_keywords: Dict[str, List[str]]) -> str:
+    """Hash of the project's preprocessing manifest and ``metric_keywords``."""
+    manifest = load_manifest(os.path.join(project_dir, "pages"))
+    # The PDF's mtime changes on copy or touch without changing any page.
+    manifest.pop("pdf_mtime_ns", None)
+    data = json.dumps([manifest, metric_keywords], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def mine_project(
+    project_dir: str,
+    workers: int = 1,
+    write: bool = True,
+    metric_keywords: Optional[Dict[str, List[str]]] = None,
+) -> ProjectCandidates:
+    """Mine all pages of a project and (by default) write ``candidates.json``.
+
+    Metrics and keywords come from the project's keyword pack
+    (``utils.METRIC_SYNONYMS`` if it has none) unless ``metric_keywords`` is
+    given. ``workers`` > 1 splits the pages across a process pool.
+    """
+    if metric_keywords is None:
+        metric_keywords = project_keywords_or_synonyms(project_dir)
+    automaton = compile_keywords(normalize_keywords(metric_keywords))
+    pages_dir = os.path.join(project_dir, "pages")
+    pages = open_page_store(pages_dir)
+
+    if workers > 1 and len(pages) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_mine_range, pages_dir, start, stop, automaton)
+                for start, stop in page_ranges(len(pages), workers)
+            ]
+            parts = [f.result() for f in futures]
+        result = {"metric_pages": {m: [] for m in automaton.metric_ids}, "page_candidates": {}, "table_candidates": {}}
+        # Ranges are contiguous and in order, so page lists stay sorted.
+        for part in parts:
+            for metric_id, page_list in part["metric_pages"].items():
+                result["metric_pages"][metric_id].extend(page_list)
+            result["page_candidates"].update(part["page_candidates"])
+            result["table_candidates"].update(part["table_candidates"])
+    else:
+        result = mine_pages(automaton, pages, pages_dir)
+
+    result["fingerprint"] = candidates_fingerprint(project_dir, metric_keywords)
+    result["summary"] = {
+        "total_pages": len(pages),
+        "pages_with_candidates": len(result["page_candidates"]),
+        "candidates": sum(
+            len(result["page_candidates"][str(page)])
+            for page_list in result["metric_pages"].values()
+            for page in page_list
+        ),
+    }
+    if write:
+        write_json(os.path.join(project_dir, CANDIDATES_NAME), result)
+    return ProjectCandidates(result)
+
+
+def load_candidates(
+    project_dir: str, metric_keywords: Optional[Dict[str, List[str]]] = None
+) -> Optional[ProjectCandidates]:
+    """Load a project's ``candidates.json``.
+
+    ``None`` if not mined yet, or mined from other pages or keywords than
+    the project's current ones (``metric_keywords`` as in :func:`mine_project`).
+    """
+    data = read_json(os.path.join(project_dir, CANDIDATES_NAME))
+    if not data:
+        return None
+    if metric_keywords is None:
+        metric_keywords = project_keywords_or_synonyms(project_dir)
+    if data.get("fingerprint") != candidates_fingerprint(project_dir, metric_keywords):
+        return None
+    return ProjectCandidates(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute heuristic candidates for all metrics and pages")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--project", help="project workspace directory")
+    group.add_argument("--all", metavar="PROJECTS_DIR", help="mine every project under this directory")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (0 = all CPUs)")
+    args = parser.parse_args()
+
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    projects = [args.project] if args.project else project_dirs(args.all)
+    start = time.perf_counter()
+    for project_dir in projects:
+        summary = mine_project(project_dir, workers=workers).data["summary"]
+        print(
+            f"{os.path.basename(os.path.normpath(project_dir))}: "
+            f"{summary['candidates']} candidates on {summary['pages_with_candidates']}/{summary['total_pages']} pages"
+        )
+    print(f"{len(projects)} project(s) in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
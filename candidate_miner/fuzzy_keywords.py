@@ -0,0 +1,193 @@
+"""Approximate metric keyword matching for OCR'd and badly extracted pages.
+
+Exact substring matching misses "C O 2", broken ligatures and Hangul that
+came out as separate jamo ("온실가ㅅㅡ"). Text and keywords are compared in a
+"squeezed" form: NFKC, lowercase, Hangul decomposed into jamo (so a split
+syllable equals the whole one and a wrong jamo costs one edit) and all
+whitespace removed. A keyword of squeezed length ``m`` may then match with
+up to ``min(max_distance, m // chars_per_error)`` edits.
+
+Candidates are filtered with the pigeonhole principle: a keyword split into
+``k + 1`` pieces matches with at most ``k`` edits only if one piece occurs
+exactly. All pieces of all keywords go into one :class:`KeywordAutomaton`,
+so a page is scanned once, and only the windows around piece hits are
+verified, with Myers' bit-parallel edit distance.
+"""
+from __future__ import annotations
+
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from .keyword_automaton import KeywordAutomaton
+
+
+@lru_cache(maxsize=8192)
+def _squeeze_char(ch: str) -> str:
+    return "".join(
+        c for c in unicodedata.normalize("NFD", unicodedata.normalize("NFKC", ch).lower()) if not c.isspace()
+    )
+
+
+def squeeze(text: str) -> Tuple[str, List[int]]:
+    """Return the squeezed text and, per squeezed char, its index in ``text``."""
+    chars: List[str] = []
+    origin: List[int] = []
+    for i, ch in enumerate(text):
+        out = _squeeze_char(ch)
+        if out:
+            chars.append(out)
+            origin.extend([i] * len(out))
+    return "".join(chars), origin
+
+
+def _split(word: str, parts: int) -> List[Tuple[int, str]]:
+    size, extra = divmod(len(word), parts)
+    pieces = []
+    start = 0
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        pieces.append((start, word[start:stop]))
+        start = stop
+    return pieces
+
+
+def _pattern_masks(pattern: str) -> Dict[str, int]:
+    masks: Dict[str, int] = {}
+    for i, ch in enumerate(pattern):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    return masks
+
+
+def _best_end(masks: Dict[str, int], m: int, text: str, lo: int, hi: int) -> Tuple[int, int]:
+    """Myers' bit-parallel approximate search of a pattern in ``text[lo:hi]``.
+
+    Returns ``(distance, end)`` of the best substring match, earliest end
+    first. ``masks`` come from :func:`_pattern_masks`.
+    """
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+    best = (m + 1, lo)
+    for j in range(lo, hi):
+        eq = masks.get(text[j], 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = (ph << 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+        if score < best[0]:
+            best = (score, j + 1)
+    return best
+
+
+class FuzzyMatch(NamedTuple):
+    start: int  # span in the original text
+    end: int
+    keyword: int  # index into FuzzyKeywordIndex.keywords
+    distance: int
+
+
+class FuzzyKeywordIndex:
+    """Approximate matcher over ``{metric_id: [keyword, ...]}``.
+
+    Exposes the same ``metric_ids``, ``keywords``, ``keyword_metrics``,
+    ``iter_matches`` and ``metrics_in`` as :class:`KeywordAutomaton`, so it
+    can replace it in page mapping and ranking.
+
+    Parameters
+    ----------
+    max_distance: int
+        Upper bound on edits per keyword occurrence.
+    chars_per_error: int
+        Squeezed keyword characters (Hangul counts per jamo) per allowed
+        edit; shorter keywords ("EV", "GHG") must match exactly.
+    """
+
+    def __init__(
+        self, metric_keywords: Dict[str, Iterable[str]], max_distance: int = 1, chars_per_error: int = 5
+    ):
+        self.metric_ids = list(metric_keywords)
+        self.keywords: List[str] = []
+        self.keyword_metrics: List[List[str]] = []
+        self._squeezed: List[str] = []
+        self._limits: List[int] = []
+        # Myers bit masks of each squeezed keyword and of its reverse.
+        self._masks: List[Tuple[Dict[str, int], Dict[str, int]]] = []
+        index: Dict[str, int] = {}
+        for metric_id, keywords in metric_keywords.items():
+            for kw in keywords:
+                squeezed = squeeze(kw)[0]
+                if not squeezed:
+                    continue
+                if squeezed not in index:
+                    index[squeezed] = len(self.keywords)
+                    self.keywords.append(kw.lower())
+                    self.keyword_metrics.append([])
+                    self._squeezed.append(squeezed)
+                    self._limits.append(min(max_distance, len(squeezed) // chars_per_error))
+                    self._masks.append((_pattern_masks(squeezed), _pattern_masks(squeezed[::-1])))
+                metrics = self.keyword_metrics[index[squeezed]]
+                if metric_id not in metrics:
+                    metrics.append(metric_id)
+
+        # piece -> [(keyword index, offset of the piece in the keyword)]
+        self._pieces: Dict[str, List[Tuple[int, int]]] = {}
+        for k, word in enumerate(self._squeezed):
+            for offset, piece in _split(word, self._limits[k] + 1):
+                self._pieces.setdefault(piece, []).append((k, offset))
+        self._automaton = KeywordAutomaton({"": list(self._pieces)})
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find(self, text: str) -> List[FuzzyMatch]:
+        """Keyword occurrences within their edit limit, by position."""
+        squeezed, origin = squeeze(text)
+        found: Dict[Tuple[int, int], FuzzyMatch] = {}
+        verified = set()
+        pieces = self._automaton.keywords
+        for pos, p in self._automaton.iter_matches(squeezed):
+            for k, offset in self._pieces[pieces[p]]:
+                limit = self._limits[k]
+                word = self._squeezed[k]
+                anchor = pos - offset
+                if (k, anchor) in verified:
+                    continue
+                verified.add((k, anchor))
+                if limit == 0 or squeezed.startswith(word, anchor):
+                    # Most hits are exact; only the rest pay for the alignment.
+                    start, end, distance = anchor, anchor + len(word), 0
+                else:
+                    lo = max(0, anchor - limit)
+                    hi = min(len(squeezed), anchor + len(word) + limit)
+                    forward, backward = self._masks[k]
+                    distance, end = _best_end(forward, len(word), squeezed, lo, hi)
+                    if distance > limit:
+                        continue
+                    # The start is where the reversed keyword ends in the reversed window.
+                    _, length = _best_end(backward, len(word), squeezed[lo:end][::-1], 0, end - lo)
+                    start = end - length
+                key = (k, origin[start])
+                if key not in found or distance < found[key].distance:
+                    found[key] = FuzzyMatch(origin[start], origin[end - 1] + 1, k, distance)
+        return sorted(found.values())
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield ``(start, keyword index)`` like ``KeywordAutomaton.iter_matches``."""
+        for match in self.find(text):
+            yield match.start, match.keyword
+
+    def metrics_in(self, text: str) -> List[str]:
+        """Return the metric ids with at least one (approximate) keyword hit."""
+        found = set()
+        for match in self.find(text):
+            found.update(self.keyword_metrics[match.keyword])
+        return [m for m in self.metric_ids if m in found]
@@ -1,33 +1,124 @@
 from __future__ import annotations
 
 """Rule-based candidate mining using regex and synonyms."""
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from utils import find_numbers_and_units, text_has_synonym
+from page_store import page_text
+from page_tables import find_cells, load_tables
+from utils import METRIC_SYNONYMS, page_view
+from word_geometry import load_words
 
+from .keyword_automaton import KeywordAutomaton
+from .keyword_packs import compile_keywords, normalize_keywords
 
-def heuristic_candidates(metric_id: str, page_meta: Dict) -> List[Dict]:
+
+def synonym_automaton() -> KeywordAutomaton:
+    """Automaton of ``utils.METRIC_SYNONYMS``, for pages of projects without keywords."""
+    return compile_keywords(normalize_keywords(METRIC_SYNONYMS))
+
+
+@lru_cache(maxsize=256)
+def _matched_metrics(automaton: KeywordAutomaton, text: str) -> Tuple[str, ...]:
+    return tuple(automaton.metrics_in(page_view(text).text))
+
+
+def page_metrics(automaton: KeywordAutomaton, page_meta: Dict) -> Tuple[str, ...]:
+    """Metrics with a keyword in the page's text layer or OCR.
+
+    The page text is normalized (``utils.page_view``), so ``automaton``
+    must be compiled from :func:`~.keyword_packs.normalize_keywords`. The
+    result is cached per page, so checking every metric scans it once.
+    """
+    return _matched_metrics(automaton, page_text(page_meta))
+
+
+def heuristic_candidates(
+    metric_id: str,
+    page_meta: Dict,
+    pages_dir: Optional[str] = None,
+    automaton: Optional[KeywordAutomaton] = None,
+) -> List[Dict]:
     """Return heuristic candidates from page metadata.
 
+    The page is about ``metric_id`` when it is in :func:`page_metrics`,
+    the same test as ``batch.mine_pages``. Matched metrics and the page's
+    numbers are cached per page, so calling this for every metric on one
+    page scans it only once. With ``pages_dir``, table cells whose row
+    label holds one of the metric's keywords come first (see
+    :func:`merge_candidates`).
+
     Parameters
     ----------
     metric_id: str
         SASB metric identifier.
     page_meta: Dict
         Dictionary with at least keys ``page`` and ``text``.
+    pages_dir: str, optional
+        The project's ``pages`` directory; when given, candidates get the
+        PDF-space ``bbox`` of the number from the stored word geometry.
+    automaton: KeywordAutomaton, optional
+        Compiled normalized metric keywords; :func:`synonym_automaton` by
+        default.
+    """
+    if automaton is None:
+        automaton = synonym_automaton()
+    if metric_id not in page_metrics(automaton, page_meta):
+        return []
+    tables = table_candidates(metric_keywords(automaton, metric_id), page_meta, pages_dir) if pages_dir else []
+    return merge_candidates(tables, number_candidates(page_meta, pages_dir))
+
+
+def metric_keywords(automaton: KeywordAutomaton, metric_id: str) -> List[str]:
+    """Keywords ``automaton`` holds for ``metric_id``."""
+    return [kw for kw, metrics in zip(automaton.keywords, automaton.keyword_metrics) if metric_id in metrics]
+
+
+def merge_candidates(tables: List[Dict], numbers: List[Dict]) -> List[Dict]:
+    """Table cell candidates, then the page's other numbers.
+
+    Numbers already offered as a table cell value are dropped.
+    """
+    seen = {c["value"] for c in tables}
+    return tables + [c for c in numbers if c["value"] not in seen]
+
+
+def number_candidates(page_meta: Dict, pages_dir: Optional[str] = None) -> List[Dict]:
+    """Return a candidate for every number on the page, regardless of metric."""
+    words = load_words(pages_dir, page_meta["page"]) if pages_dir else None
+    results: List[Dict] = []
+    for token in page_view(page_meta.get("text", "")).numbers:
+        results.append(
+            {
+                "page": page_meta["page"],
+                "value": token.number,
+                "unit": token.unit,
+                "category": "quantitative",
+                "bbox": words.span_bbox(token.start, token.end) if words is not None else None,
+            }
+        )
+    return results
+
+
+def table_candidates(
+    keywords: Iterable[str], page_meta: Dict, pages_dir: str, year: Optional[str] = None
+) -> List[Dict]:
+    """Return candidates from table cells whose row label matches ``keywords``.
+
+    ``year`` restricts the cells to columns whose header contains it.
+    ``bbox`` is the cell box in PDF coordinates.
     """
-    text = page_meta.get("text", "")
     results: List[Dict] = []
-    if not text_has_synonym(metric_id, text):
-        return results
-    for value, unit, _ in find_numbers_and_units(text):
+    for cell in find_cells(load_tables(page_meta, pages_dir), keywords, year):
         results.append(
             {
                 "page": page_meta["page"],
-                "value": value,
-                "unit": unit,
+                "value": cell["text"],
+                "unit": cell["unit"],
                 "category": "quantitative",
-                "bbox": None,
+                "bbox": cell["bbox"],
+                "row_header": cell["row_header"],
+                "col_header": cell["col_header"],
             }
         )
     return results
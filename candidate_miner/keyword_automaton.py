@@ -0,0 +1,105 @@
+"""Aho-Corasick multi-pattern matcher for metric keywords.
+
+All keywords of all metrics are compiled into one automaton, so a page is
+scanned once no matter how many metrics and keywords there are. Matching is
+case-insensitive substring matching, the same semantics as the
+``keyword.lower() in page_text.lower()`` loop it replaces.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over ``{metric_id: [keyword, ...]}``.
+
+    Parameters
+    ----------
+    metric_keywords: Dict[str, Iterable[str]]
+        Keywords per metric. A keyword shared by several metrics is stored
+        once and reported for each of them.
+    """
+
+    def __init__(self, metric_keywords: Dict[str, Iterable[str]]):
+        self.keywords: List[str] = []
+        # keyword index -> metric ids that list it
+        self.keyword_metrics: List[List[str]] = []
+        index: Dict[str, int] = {}
+        for metric_id, keywords in metric_keywords.items():
+            for kw in keywords:
+                kw = kw.lower()
+                if not kw:
+                    continue
+                if kw not in index:
+                    index[kw] = len(self.keywords)
+                    self.keywords.append(kw)
+                    self.keyword_metrics.append([])
+                metrics = self.keyword_metrics[index[kw]]
+                if metric_id not in metrics:
+                    metrics.append(metric_id)
+        self.metric_ids = list(metric_keywords)
+        self._build()
+
+    def _build(self) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for k, kw in enumerate(self.keywords):
+            state = 0
+            for ch in kw:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(k)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                # Inherit the matches of the longest proper suffix.
+                out[nxt] = out[nxt] + out[fail[nxt]]
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._lengths = [len(kw) for kw in self.keywords]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield ``(start, keyword index)`` for every keyword occurrence."""
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        state = 0
+        for pos, ch in enumerate(text.lower()):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                for k in out[state]:
+                    yield pos - lengths[k] + 1, k
+
+    def find(self, text: str) -> Dict[str, List[Tuple[int, str]]]:
+        """Return ``{metric_id: [(start, keyword), ...]}`` for metrics hit in ``text``."""
+        hits: Dict[str, List[Tuple[int, str]]] = {}
+        for start, k in self.iter_matches(text):
+            kw = self.keywords[k]
+            for metric_id in self.keyword_metrics[k]:
+                hits.setdefault(metric_id, []).append((start, kw))
+        return hits
+
+    def metrics_in(self, text: str) -> List[str]:
+        """Return the metric ids with at least one keyword in ``text``."""
+        found = set()
+        for _, k in self.iter_matches(text):
+            found.update(self.keyword_metrics[k])
+        return [m for m in self.metric_ids if m in found]
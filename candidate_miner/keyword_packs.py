@@ -0,0 +1,105 @@
+"""Keyword packs per SASB industry, with per-project overrides.
+
+Metric keywords are data, not code: ``keyword_packs/<industry>.json`` holds
+``metric_keywords`` for one SASB industry (``TC-HW``, ``TR-AU``, ``TC-SC``,
+...) and every project picks a pack in ``projects/<name>/keywords.json``::
+
+    {"pack": "TC-HW",
+     "add": {"TC-HW-410a.1": ["IECQ"]},
+     "remove": {"TC-HW-230a.1": ["사고"]}}
+
+A keyword fix in a pack therefore reaches every project using it. Resolved
+keywords are compiled into a :class:`KeywordAutomaton` once per process,
+keyed by their content, so an edited pack or override is recompiled.
+
+Projects that still carry a legacy ``metric_keywords.py`` are read from it.
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from utils import METRIC_SYNONYMS, normalize_text
+
+from .keyword_automaton import KeywordAutomaton
+
+PACKS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "keyword_packs")
+PROJECT_KEYWORDS_NAME = "keywords.json"
+LEGACY_KEYWORDS_NAME = "metric_keywords.py"
+
+
+def has_keywords(project_dir: str) -> bool:
+    return any(
+        os.path.exists(os.path.join(project_dir, name))
+        for name in (PROJECT_KEYWORDS_NAME, LEGACY_KEYWORDS_NAME)
+    )
+
+
+def load_pack(industry: str, packs_dir: str = PACKS_DIR) -> Dict[str, List[str]]:
+    """Return ``metric_keywords`` of the pack for ``industry``."""
+    path = os.path.join(packs_dir, f"{industry}.json")
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No keyword pack for industry {industry!r}: {path}")
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["metric_keywords"]
+
+
+def resolve_keywords(config: Dict, packs_dir: str = PACKS_DIR) -> Dict[str, List[str]]:
+    """Apply a project's ``add``/``remove`` overrides to its pack."""
+    keywords = {m: list(kws) for m, kws in load_pack(config["pack"], packs_dir).items()}
+    for metric_id, extra in config.get("add", {}).items():
+        current = keywords.setdefault(metric_id, [])
+        current.extend(kw for kw in extra if kw not in current)
+    for metric_id, dropped in config.get("remove", {}).items():
+        if metric_id in keywords:
+            keywords[metric_id] = [kw for kw in keywords[metric_id] if kw not in dropped]
+    return keywords
+
+
+def _load_legacy(path: str) -> Dict[str, List[str]]:
+    spec = importlib.util.spec_from_file_location(f"metric_keywords_{abs(hash(path))}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.METRIC_KEYWORDS
+
+
+def project_keywords(project_dir: str, packs_dir: str = PACKS_DIR) -> Dict[str, List[str]]:
+    """Return the resolved ``{metric_id: [keyword, ...]}`` of a project."""
+    path = os.path.join(project_dir, PROJECT_KEYWORDS_NAME)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return resolve_keywords(json.load(f), packs_dir)
+    legacy = os.path.join(project_dir, LEGACY_KEYWORDS_NAME)
+    if os.path.exists(legacy):
+        return _load_legacy(legacy)
+    raise FileNotFoundError(f"No {PROJECT_KEYWORDS_NAME} in {project_dir}")
+
+
+def project_keywords_or_synonyms(project_dir: Optional[str]) -> Dict[str, List[str]]:
+    """Keywords of ``project_dir``; ``utils.METRIC_SYNONYMS`` without a project or keywords."""
+    if project_dir and has_keywords(project_dir):
+        return project_keywords(project_dir)
+    return METRIC_SYNONYMS
+
+
+def normalize_keywords(metric_keywords: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """``metric_keywords`` through ``utils.normalize_text``, to match normalized page text."""
+    return {m: [normalize_text(kw) for kw in kws] for m, kws in metric_keywords.items()}
+
+
+@lru_cache(maxsize=32)
+def _compiled(data: str) -> KeywordAutomaton:
+    return KeywordAutomaton(json.loads(data))
+
+
+def compile_keywords(metric_keywords: Dict[str, List[str]]) -> KeywordAutomaton:
+    """Return the automaton for ``metric_keywords``, built at most once per content."""
+    return _compiled(json.dumps(metric_keywords, ensure_ascii=False, separators=(",", ":")))
+
+
+def project_automaton(project_dir: str, packs_dir: str = PACKS_DIR) -> KeywordAutomaton:
+    """Compiled keyword automaton of a project."""
+    return compile_keywords(project_keywords(project_dir, packs_dir))
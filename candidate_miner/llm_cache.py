@@ -0,0 +1,131 @@
+"""Persistent cache of LLM candidate responses.
+
+Re-opening a project or re-selecting a metric sends the exact same request
+again. Responses are stored per project in ``<project>/llm_cache.sqlite``,
+keyed by the SHA-256 of the model and the request payload (metric fields and
+page text), so any change to the prompt, the page text or the model is a
+miss. Entries older than ``max_age_days`` are dropped and, once the store
+exceeds ``max_bytes``, the least recently used ones go first.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from utils import ensure_dir
+
+LLM_CACHE_NAME = "llm_cache.sqlite"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_AGE_DAYS = 30
+# Run eviction after this many writes rather than on every one.
+EVICT_EVERY = 64
+
+
+def cache_key(model: str, payload: Dict) -> str:
+    """Content address of a request."""
+    data = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{model}\n{data}".encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """SQLite-backed response store, safe to share between threads."""
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        ensure_dir(os.path.dirname(os.path.abspath(path)))
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,"
+            " created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self.evict()
+
+    @classmethod
+    def for_project(cls, project_dir: str, config: Optional[Dict] = None) -> "LLMCache":
+        """Cache of a project; limits from ``llm_cache_max_mb`` / ``llm_cache_max_age_days``."""
+        config = config or {}
+        return cls(
+            os.path.join(project_dir, LLM_CACHE_NAME),
+            max_bytes=int(config.get("llm_cache_max_mb", DEFAULT_MAX_BYTES / 1024 / 1024) * 1024 * 1024),
+            max_age_days=config.get("llm_cache_max_age_days", DEFAULT_MAX_AGE_DAYS),
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM responses WHERE key = ? AND created >= ?", (key, now - self.max_age)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        data = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, data, len(data.encode("utf-8")), now, now),
+            )
+            self._writes += 1
+            due = self._writes % EVICT_EVERY == 0
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired entries, then LRU ones down to ``max_bytes``; returns the count."""
+        with self._lock:
+            removed = self._db.execute(
+                "DELETE FROM responses WHERE created < ?", (time.time() - self.max_age,)
+            ).rowcount
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                doomed = []
+                for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed"):
+                    if total <= self.max_bytes:
+                        break
+                    doomed.append((key,))
+                    total -= size
+                self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+                removed += len(doomed)
+        return removed
+
+    def stats(self) -> Dict:
+        with self._lock:
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": size}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
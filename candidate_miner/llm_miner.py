@@ -1,13 +1,134 @@
-"""LLM-powered candidate mining via OpenAI-compatible Responses API."""
+"""LLM-powered candidate mining via OpenAI-compatible Responses API.
+
+:func:`llm_candidates` sends one (metric, page) request and blocks;
+:func:`llm_page_candidates` asks about several metrics of one page in a
+single request, so the page text is sent once instead of once per metric.
+:func:`mine_llm` fans many requests out against the same endpoint with at
+most ``concurrency`` in flight, so mining a whole project is bounded by the
+endpoint's throughput instead of the sum of round-trip latencies. Pass an
+:class:`LLMClient` to reuse keep-alive connections across requests and an
+:class:`~candidate_miner.llm_cache.LLMCache` to answer repeated ones locally.
+With ``config["llm_context_tokens"]`` set, only the page text around the
+metrics' keywords and numbers is sent (see :mod:`.page_context`).
+"""
 from __future__ import annotations
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
 import requests
-from typing import Dict, List
+from requests.adapters import HTTPAdapter
+
+from utils import METRIC_SYNONYMS
+
+from .llm_cache import LLMCache, cache_key
+from .prompts import build_batch_candidate_payload, build_candidate_payload, split_batch_candidates
+
+LLM_TIMEOUT = 30
+DEFAULT_CONCURRENCY = 8
+# Metrics asked about per request when jobs share a page.
+DEFAULT_BATCH_METRICS = 8
+
+if TYPE_CHECKING:
+    from .page_context import PageContext
+
+# One LLM request: (metric, page_text).
+LLMJob = Tuple[Dict, str]
+
+
+def llm_concurrency(config: Dict) -> int:
+    """``config["llm_concurrency"]``, at least 1."""
+    return max(1, int(config.get("llm_concurrency") or DEFAULT_CONCURRENCY))
+
+
+def llm_batch_metrics(config: Dict) -> int:
+    """``config["llm_batch_metrics"]``, at least 1 (1 disables batching)."""
+    return max(1, int(config.get("llm_batch_metrics") or DEFAULT_BATCH_METRICS))
+
+
+class LLMClient:
+    """Long-lived HTTP session for one LLM endpoint.
+
+    Connections are kept alive and pooled, up to ``pool_size`` (default
+    :func:`llm_concurrency`) per host, so concurrent requests never open
+    more sockets than the concurrency limit and sequential ones skip the
+    TCP/TLS handshake. Safe to share between threads.
+    """
 
-from .prompts import build_candidate_payload
+    def __init__(self, config: Dict, pool_size: Optional[int] = None):
+        self.config = config
+        self.pool_size = pool_size or llm_concurrency(config)
+        self.session = requests.Session()
+        # pool_block: wait for a free connection instead of opening throwaway ones.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, pool_block=True)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._adapter = adapter
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        # Page text windowing totals (see record_context).
+        self.page_chars = 0
+        self.page_chars_sent = 0
+        self.numbers = 0
+        self.numbers_sent = 0
 
+    def record_context(self, context: PageContext) -> None:
+        with self._lock:
+            self.page_chars += context.total_chars
+            self.page_chars_sent += context.kept_chars
+            self.numbers += context.numbers_total
+            self.numbers_sent += context.numbers_kept
 
-def llm_candidates(metric: Dict, page_text: str, config: Dict) -> List[Dict]:
+    def post(self, url: str, **kwargs) -> requests.Response:
+        with self._lock:
+            self.requests += 1
+        try:
+            return self.session.post(url, **kwargs)
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+
+    def stats(self) -> Dict:
+        """Request and connection counters of the pool.
+
+        ``connections`` counts sockets opened; with keep-alive it stays at
+        most ``pool_size`` per host however many ``requests`` were sent.
+        ``context_dropped_ratio`` and ``context_number_recall`` cover the
+        windowed prompts built so far.
+        """
+        pools = self._adapter.poolmanager.pools
+        conn_pools = [pools[key] for key in pools.keys()]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "connections": sum(pool.num_connections for pool in conn_pools),
+            "hosts": len(conn_pools),
+            "pool_size": self.pool_size,
+            "context_dropped_ratio": 1 - self.page_chars_sent / self.page_chars if self.page_chars else 0.0,
+            "context_number_recall": self.numbers_sent / self.numbers if self.numbers else 1.0,
+        }
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def llm_candidates(
+    metric: Dict,
+    page_text: str,
+    config: Dict,
+    client: Optional[LLMClient] = None,
+    cache: Optional[LLMCache] = None,
+) -> List[Dict]:
     """Query external LLM for candidate annotations.
 
     Parameters
@@ -18,21 +139,217 @@ def llm_candidates(metric: Dict, page_text: str, config: Dict) -> List[Dict]:
         Text content of the page.
     config: Dict
         Configuration containing ``llm_base_url``, ``api_key`` and ``llm_model``.
+    client: LLMClient, optional
+        Pooled session to send the request with; a one-off connection
+        otherwise.
+    cache: LLMCache, optional
+        Response cache; only successful responses are stored.
     """
-    base = config.get("llm_base_url")
-    key = config.get("api_key")
-    model = config.get("llm_model")
-    if not (base and key and model):
+    model = _model(config)
+    if model is None:
         return []
+    payload = build_candidate_payload(model, metric, _prompt_text([metric], page_text, config, client))
+    result = _send(payload, config, client, cache, lambda data: data.get("candidates", []))
+    return result if result is not None else []
+
+
+def llm_page_candidates(
+    metrics: List[Dict],
+    page_text: str,
+    config: Dict,
+    client: Optional[LLMClient] = None,
+    cache: Optional[LLMCache] = None,
+) -> List[List[Dict]]:
+    """Candidates of every metric in ``metrics`` on one page, in one request.
+
+    Returns one candidate list per metric, in order. A single metric uses
+    the plain :func:`llm_candidates` request.
+    """
+    if len(metrics) == 1:
+        return [llm_candidates(metrics[0], page_text, config, client, cache)]
+    model = _model(config)
+    if model is None or not metrics:
+        return [[] for _ in metrics]
+    payload = build_batch_candidate_payload(model, metrics, _prompt_text(metrics, page_text, config, client))
+    result = _send(payload, config, client, cache, lambda data: split_batch_candidates(data, metrics))
+    return result if result is not None else [[] for _ in metrics]
+
+
+def _model(config: Dict) -> Optional[str]:
+    """The configured model, or ``None`` if the endpoint is not fully configured."""
+    if config.get("llm_base_url") and config.get("api_key") and config.get("llm_model"):
+        return config["llm_model"]
+    return None
+
+
+def llm_configured(config: Dict) -> bool:
+    """Whether ``config`` has the endpoint, key and model LLM mining needs."""
+    return _model(config) is not None
 
-    payload = build_candidate_payload(model, metric, page_text)
-    url = f"{base}/responses"
-    headers = {"Authorization": f"Bearer {key}"}
+
+def _prompt_text(metrics: List[Dict], page_text: str, config: Dict, client: Optional[LLMClient]) -> str:
+    """``page_text`` cut to ``config["llm_context_tokens"]`` around the metrics' keywords.
+
+    Keywords are ``metric["keywords"]`` (``CandidateMiner`` fills in the
+    project's keyword pack), else ``utils.METRIC_SYNONYMS`` of the metric
+    code. Without a budget the page is sent whole.
+    """
+    budget = config.get("llm_context_tokens")
+    if not budget:
+        return page_text
+    # Imported here so ``python -m candidate_miner.page_context`` runs cleanly.
+    from .page_context import build_page_context
+
+    keywords = [
+        kw for m in metrics for kw in (m.get("keywords") or METRIC_SYNONYMS.get(m.get("metric_code", ""), []))
+    ]
+    context = build_page_context(page_text, keywords, int(budget))
+    if client is not None:
+        client.record_context(context)
+    return context.text
+
+
+def _send(
+    payload: Dict,
+    config: Dict,
+    client: Optional[LLMClient],
+    cache: Optional[LLMCache],
+    parse: Callable[[Dict], Any],
+) -> Any:
+    """POST ``payload`` and return ``parse(response JSON)``; ``None`` on failure.
+
+    Parsed results are cached; failures are not.
+    """
+    key = cache_key(payload["model"], payload) if cache is not None else None
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    url = f"{config['llm_base_url']}/responses"
+    headers = {"Authorization": f"Bearer {config['api_key']}"}
 
     try:
-        resp = requests.post(url, json=payload, headers=headers, timeout=30)
+        post = client.post if client is not None else requests.post
+        resp = post(url, json=payload, headers=headers, timeout=LLM_TIMEOUT)
         resp.raise_for_status()
-        data = resp.json()
-        return data.get("candidates", [])
+        result = parse(resp.json())
     except Exception:
-        return []
+        return None
+    if key is not None:
+        cache.put(key, result)
+    return result
+
+
+def _page_groups(jobs: List[LLMJob], batch_metrics: int) -> List[List[int]]:
+    """Group job indices that ask about the same page, at most ``batch_metrics`` each."""
+    groups: List[List[int]] = []
+    open_groups: Dict[Tuple[str, Any], List[int]] = {}
+    for i, (metric, page_text) in enumerate(jobs):
+        key = (page_text, metric.get("page_no"))
+        group = open_groups.get(key)
+        codes = {jobs[j][0].get("metric_code") for j in group} if group else ()
+        if group is None or len(group) >= batch_metrics or metric.get("metric_code") in codes:
+            group = open_groups[key] = []
+            groups.append(group)
+        group.append(i)
+    return groups
+
+
+async def iter_llm_candidates(
+    jobs: Iterable[LLMJob],
+    config: Dict,
+    concurrency: Optional[int] = None,
+    client: Optional[LLMClient] = None,
+    cache: Optional[LLMCache] = None,
+    batch_metrics: int = 1,
+) -> AsyncIterator[Tuple[int, List[Dict]]]:
+    """Yield ``(job index, candidates)`` for ``jobs`` as responses arrive.
+
+    Jobs on the same page (same ``page_text`` and ``page_no``) are sent
+    together, up to ``batch_metrics`` per request (see
+    :func:`llm_page_candidates`); the default 1 sends one request per job.
+    At most ``concurrency`` (default :func:`llm_concurrency`) requests are in
+    flight. Requests run in a thread pool of that size rather than asyncio's
+    default executor, which is capped by the CPU count. Without ``client``
+    a temporary pooled one is used for the batch.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return
+    limit = concurrency or llm_concurrency(config)
+    semaphore = asyncio.Semaphore(limit)
+    loop = asyncio.get_running_loop()
+
+    own_client = client is None
+    if own_client:
+        client = LLMClient(config, pool_size=limit)
+
+    groups = _page_groups(jobs, max(1, batch_metrics))
+    pool = ThreadPoolExecutor(max_workers=min(limit, len(groups)))
+
+    async def run(group: List[int]) -> List[Tuple[int, List[Dict]]]:
+        metrics = [jobs[i][0] for i in group]
+        page_text = jobs[group[0]][1]
+        async with semaphore:
+            result = await loop.run_in_executor(
+                pool, llm_page_candidates, metrics, page_text, config, client, cache
+            )
+        return list(zip(group, result))
+
+    tasks = [asyncio.create_task(run(group)) for group in groups]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            for item in await finished:
+                yield item
+    finally:
+        # Consumer stopped early: drop the queued requests, let the running
+        # ones finish off the event loop, and only then close the client
+        # they post through.
+        for task in tasks:
+            task.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+        await loop.run_in_executor(None, pool.shutdown)
+        if own_client:
+            client.close()
+
+
+async def mine_llm_async(
+    jobs: Iterable[LLMJob],
+    config: Dict,
+    concurrency: Optional[int] = None,
+    client: Optional[LLMClient] = None,
+    cache: Optional[LLMCache] = None,
+    batch_metrics: int = 1,
+) -> List[List[Dict]]:
+    """Candidates for every job, in job order."""
+    jobs = list(jobs)
+    results: List[List[Dict]] = [[] for _ in jobs]
+    async for index, candidates in iter_llm_candidates(jobs, config, concurrency, client, cache, batch_metrics):
+        results[index] = candidates
+    return results
+
+
+def mine_llm(
+    jobs: Iterable[LLMJob],
+    config: Dict,
+    concurrency: Optional[int] = None,
+    client: Optional[LLMClient] = None,
+    cache: Optional[LLMCache] = None,
+    batch_metrics: int = 1,
+) -> List[List[Dict]]:
+    """Blocking form of :func:`mine_llm_async`.
+
+    Inside a running event loop (Jupyter, async callers), where
+    ``asyncio.run`` is not allowed, the batch runs on its own loop in a
+    worker thread.
+    """
+
+    def run() -> List[List[Dict]]:
+        return asyncio.run(mine_llm_async(jobs, config, concurrency, client, cache, batch_metrics))
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return run()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(run).result()
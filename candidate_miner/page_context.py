@@ -0,0 +1,151 @@
+"""Relevance-windowed page text for LLM prompts.
+
+Dense table pages run to thousands of tokens, most of which have nothing to
+do with the metric asked about. :func:`build_page_context` keeps only
+windows around keyword hits and numbers, under an approximate token budget:
+
+1. windows around each keyword hit, those holding the most numbers first;
+2. windows around the remaining numbers, closest to a keyword hit first.
+
+Kept runs are joined with :data:`SEPARATOR` in page order. Pages already
+within the budget are passed through unchanged. The returned
+:class:`PageContext` records how much text was dropped and how many of the
+page's numbers survived, so recall loss can be measured without an LLM::
+
+    python -m candidate_miner.page_context --project projects/samsung_2024 --tokens 300 600 1200
+"""
+from __future__ import annotations
+
+import argparse
+from bisect import bisect_left
+from typing import Iterable, List, NamedTuple, Tuple
+
+import numpy as np
+
+from page_store import open_page_store, page_text as record_text
+from utils import find_numbers_and_units
+
+from .keyword_packs import compile_keywords, project_keywords
+
+DEFAULT_WINDOW_CHARS = 200
+SEPARATOR = "\n…\n"
+# Rough tokenizer ratios: English ~4 characters per token, Hangul ~1.5.
+ASCII_CHARS_PER_TOKEN = 4.0
+OTHER_CHARS_PER_TOKEN = 1.5
+
+
+class PageContext(NamedTuple):
+    text: str
+    spans: List[Tuple[int, int]]  # kept character ranges of the page text
+    total_chars: int
+    kept_chars: int
+    numbers_total: int
+    numbers_kept: int
+
+    @property
+    def dropped_ratio(self) -> float:
+        return 1 - self.kept_chars / self.total_chars if self.total_chars else 0.0
+
+    @property
+    def number_recall(self) -> float:
+        return self.numbers_kept / self.numbers_total if self.numbers_total else 1.0
+
+
+def _char_costs(text: str) -> np.ndarray:
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    return np.where(codes < 128, 1 / ASCII_CHARS_PER_TOKEN, 1 / OTHER_CHARS_PER_TOKEN)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of ``text`` for budgeting."""
+    return int(np.ceil(_char_costs(text).sum())) if text else 0
+
+
+def _full(text: str, numbers: int) -> PageContext:
+    return PageContext(text, [(0, len(text))] if text else [], len(text), len(text), numbers, numbers)
+
+
+def build_page_context(
+    page_text: str,
+    keywords: Iterable[str],
+    token_budget: int,
+    window: int = DEFAULT_WINDOW_CHARS,
+) -> PageContext:
+    """Return the parts of ``page_text`` relevant to ``keywords`` within ``token_budget``.
+
+    ``window`` is the number of characters kept on each side of a keyword
+    hit (half of it around a number).
+    """
+    n = len(page_text)
+    numbers = [span for _, _, span in find_numbers_and_units(page_text)]
+    costs = _char_costs(page_text)
+    if costs.sum() <= token_budget:
+        return _full(page_text, len(numbers))
+
+    keywords = sorted({k for k in keywords if k})
+    hits: List[Tuple[int, int]] = []
+    if keywords:
+        automaton = compile_keywords({"": keywords})
+        hits = sorted(
+            (start, start + len(automaton.keywords[k])) for start, k in automaton.iter_matches(page_text)
+        )
+    number_starts = [s for s, _ in numbers]
+    hit_starts = [s for s, _ in hits]
+
+    def numbers_in(lo: int, hi: int) -> int:
+        return bisect_left(number_starts, hi) - bisect_left(number_starts, lo)
+
+    def keyword_distance(pos: int) -> int:
+        i = bisect_left(hit_starts, pos)
+        near = [abs(hit_starts[j] - pos) for j in (i - 1, i) if 0 <= j < len(hit_starts)]
+        return min(near, default=n)
+
+    keyword_windows = [(max(0, s - window), min(n, e + window)) for s, e in hits]
+    keyword_windows.sort(key=lambda w: (-numbers_in(*w), w[0]))
+    half = window // 2
+    number_windows = [(max(0, s - half), min(n, e + half)) for s, e in numbers]
+    number_windows.sort(key=lambda w: (keyword_distance(w[0]), w[0]))
+
+    kept = np.zeros(n, dtype=bool)
+    # Every window may start a new run, which costs a separator.
+    separator = _char_costs(SEPARATOR).sum()
+    used = 0.0
+    for lo, hi in keyword_windows + number_windows:
+        extra = costs[lo:hi][~kept[lo:hi]].sum()
+        if not extra:
+            continue  # already kept
+        extra += separator
+        if used + extra <= token_budget:
+            kept[lo:hi] = True
+            used += extra
+    if not kept.any():
+        # Nothing to anchor on (or no window fits): keep the head of the page.
+        kept[: int(np.searchsorted(np.cumsum(costs), token_budget, side="right"))] = True
+
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], kept.view(np.int8), [0]))))
+    spans = [(int(lo), int(hi)) for lo, hi in zip(edges[::2], edges[1::2])]
+    text = SEPARATOR.join(page_text[lo:hi].strip() for lo, hi in spans)
+    numbers_kept = sum(1 for s, e in numbers if kept[s:e].all())
+    return PageContext(text, spans, n, int(kept.sum()), len(numbers), numbers_kept)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure relevance-windowed page text per token budget")
+    parser.add_argument("--project", required=True, help="project workspace directory")
+    parser.add_argument("--tokens", type=int, nargs="+", default=[300, 600, 1200], help="token budgets")
+    args = parser.parse_args()
+
+    metric_keywords = project_keywords(args.project)
+    pages = [record_text(p) for p in open_page_store(f"{args.project}/pages")]
+    full = sum(estimate_tokens(text) for text in pages) * len(metric_keywords)
+    print(f"{len(pages)} pages x {len(metric_keywords)} metrics, {full} tokens unwindowed")
+    for budget in args.tokens:
+        contexts = [build_page_context(text, kws, budget) for text in pages for kws in metric_keywords.values()]
+        sent = sum(estimate_tokens(c.text) for c in contexts)
+        dropped = 1 - sum(c.kept_chars for c in contexts) / max(1, sum(c.total_chars for c in contexts))
+        recall = sum(c.numbers_kept for c in contexts) / max(1, sum(c.numbers_total for c in contexts))
+        print(f"budget {budget}: {sent} tokens ({sent / max(1, full):.0%}), dropped {dropped:.0%}, number recall {recall:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Build ``metric_page_mapping.json`` with one keyword automaton pass per page.
+
+Replaces the per-metric, per-keyword substring loop of
+``heuristic_analysis.ipynb``: the project's metric keywords (its keyword
+pack, see :mod:`candidate_miner.keyword_packs`) are compiled into a single
+:class:`KeywordAutomaton` and each page is scanned once.
+
+With ``--scoring bm25`` each metric keeps only its ``--top_k`` best pages by
+BM25 score (see :mod:`candidate_miner.page_ranking`) instead of every page
+with a keyword hit; the ranked scores are written to ``metric_page_scores``.
+``--fuzzy N`` also accepts keyword occurrences up to N edits away (OCR
+noise, spaced-out letters, split Hangul; see
+:mod:`candidate_miner.fuzzy_keywords`).
+
+Usage::
+
+    python -m candidate_miner.page_mapping --project projects/samsung_2024
+    python -m candidate_miner.page_mapping --all projects --scoring bm25 --top_k 10
+    python -m candidate_miner.page_mapping --all projects --fuzzy 1
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Dict, Iterable, List, Sequence
+
+from page_store import open_page_store, page_text, project_dirs
+from utils import write_json
+
+from .fuzzy_keywords import FuzzyKeywordIndex
+from .keyword_automaton import KeywordAutomaton
+from .keyword_packs import has_keywords, project_automaton, project_keywords
+from .page_ranking import rank_pages
+
+SCORING_MODES = ("binary", "bm25")
+
+
+def _mapping_document(mapping: Dict[str, List[int]], total_pages: int) -> Dict:
+    related = set()
+    for page_list in mapping.values():
+        related.update(page_list)
+    excluded = sorted(set(range(1, total_pages + 1)) - related)
+    return {
+        "metric_page_mapping": mapping,
+        "summary": {
+            "total_pages": total_pages,
+            "related_pages": len(related),
+            "excluded_pages": len(excluded),
+            "efficiency": f"{len(related) / total_pages * 100:.1f}%" if total_pages else "0.0%",
+        },
+        "excluded_page_list": excluded,
+    }
+
+
+def map_pages(automaton: KeywordAutomaton, pages: Iterable[Dict]) -> Dict:
+    """Return the mapping document for ``pages``.
+
+    Same layout the notebook wrote: ``metric_page_mapping`` (metric -> sorted
+    page numbers), ``summary`` and ``excluded_page_list``.
+    """
+    mapping: Dict[str, List[int]] = {metric_id: [] for metric_id in automaton.metric_ids}
+    total_pages = 0
+    for page in pages:
+        total_pages += 1
+        for metric_id in automaton.metrics_in(page_text(page)):
+            mapping[metric_id].append(page["page"])
+    return _mapping_document(mapping, total_pages)
+
+
+def rank_page_mapping(automaton: KeywordAutomaton, pages: Sequence[Dict], top_k: int = 10) -> Dict:
+    """Like :func:`map_pages`, keeping each metric's ``top_k`` pages by BM25.
+
+    ``metric_page_mapping`` stays sorted by page number; the ranking itself
+    is stored as ``metric_page_scores`` (``[{"page", "score"}, ...]``, best
+    first).
+    """
+    ranked = rank_pages(automaton, pages, top_k)
+    result = _mapping_document(
+        {metric_id: sorted(page for page, _ in hits) for metric_id, hits in ranked.items()},
+        len(pages),
+    )
+    result["summary"]["scoring"] = "bm25"
+    result["summary"]["top_k"] = top_k
+    result["metric_page_scores"] = {
+        metric_id: [{"page": page, "score": round(score, 4)} for page, score in hits]
+        for metric_id, hits in ranked.items()
+    }
+    return result
+
+
+def build_page_mapping(
+    project_dir: str, write: bool = True, scoring: str = "binary", top_k: int = 10, fuzzy: int = 0
+) -> Dict:
+    """Build (and by default write) ``metric_page_mapping.json`` for a project.
+
+    ``fuzzy`` > 0 matches keywords with up to that many edits.
+    """
+    if scoring not in SCORING_MODES:
+        raise ValueError(f"Unknown scoring mode: {scoring}")
+    if fuzzy > 0:
+        automaton = FuzzyKeywordIndex(project_keywords(project_dir), max_distance=fuzzy)
+    else:
+        automaton = project_automaton(project_dir)
+    pages = open_page_store(os.path.join(project_dir, "pages"))
+    if scoring == "bm25":
+        result = rank_page_mapping(automaton, pages, top_k)
+    else:
+        result = map_pages(automaton, pages)
+    if write:
+        write_json(os.path.join(project_dir, "metric_page_mapping.json"), result)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build metric_page_mapping.json from keywords")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--project", help="project workspace directory")
+    group.add_argument("--all", metavar="PROJECTS_DIR", help="rebuild every project under this directory")
+    parser.add_argument("--scoring", choices=SCORING_MODES, default="binary", help="page selection per metric")
+    parser.add_argument("--top_k", type=int, default=10, help="pages kept per metric with --scoring bm25")
+    parser.add_argument("--fuzzy", type=int, default=0, help="max edits per keyword occurrence (0 = exact)")
+    args = parser.parse_args()
+
+    projects = [args.project] if args.project else [d for d in project_dirs(args.all) if has_keywords(d)]
+    start = time.perf_counter()
+    for project_dir in projects:
+        summary = build_page_mapping(project_dir, scoring=args.scoring, top_k=args.top_k, fuzzy=args.fuzzy)["summary"]
+        print(
+            f"{os.path.basename(os.path.normpath(project_dir))}: "
+            f"{summary['related_pages']}/{summary['total_pages']} pages related ({summary['efficiency']})"
+        )
+    print(f"{len(projects)} project(s) in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""BM25 ranking of pages per metric over ``METRIC_KEYWORDS``.
+
+A binary "any keyword hit" mapping marks nearly every page of a report as
+related. Here every metric's keyword list is treated as a BM25 query and all
+metrics are scored at once: one automaton pass per page collects a sparse
+page x keyword term-frequency matrix, which is BM25-weighted and multiplied
+by the sparse keyword x metric incidence matrix.
+
+Keywords are substrings rather than tokens, so document length is measured
+in non-whitespace characters.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from page_store import page_text
+
+from .keyword_automaton import KeywordAutomaton
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def keyword_counts(
+    automaton: KeywordAutomaton, pages: Iterable[Dict]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Scan ``pages`` once and return the sparse term-frequency matrix.
+
+    Returns ``(page_numbers, doc_lengths, rows, cols, tf)``: ``rows`` index
+    into ``page_numbers``, ``cols`` into ``automaton.keywords``.
+    """
+    page_numbers: List[int] = []
+    lengths: List[int] = []
+    rows: List[int] = []
+    cols: List[int] = []
+    tf: List[int] = []
+    for row, page in enumerate(pages):
+        text = page_text(page)
+        page_numbers.append(page["page"])
+        lengths.append(len(text) - sum(ch.isspace() for ch in text))
+        counts: Dict[int, int] = {}
+        for _, k in automaton.iter_matches(text):
+            counts[k] = counts.get(k, 0) + 1
+        rows.extend([row] * len(counts))
+        cols.extend(counts)
+        tf.extend(counts.values())
+    return (
+        np.asarray(page_numbers, dtype=np.int64),
+        np.asarray(lengths, dtype=np.float64),
+        np.asarray(rows, dtype=np.int64),
+        np.asarray(cols, dtype=np.int64),
+        np.asarray(tf, dtype=np.float64),
+    )
+
+
+def _keyword_metric_incidence(automaton: KeywordAutomaton) -> Tuple[np.ndarray, np.ndarray]:
+    """CSR form of the keyword x metric matrix: ``(indptr, metric indices)``."""
+    metric_index = {m: i for i, m in enumerate(automaton.metric_ids)}
+    indptr = [0]
+    indices: List[int] = []
+    for metrics in automaton.keyword_metrics:
+        indices.extend(metric_index[m] for m in metrics)
+        indptr.append(len(indices))
+    return np.asarray(indptr, dtype=np.int64), np.asarray(indices, dtype=np.int64)
+
+
+def bm25_scores(
+    automaton: KeywordAutomaton, pages: Iterable[Dict], k1: float = BM25_K1, b: float = BM25_B
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(page_numbers, scores)`` with ``scores[page, metric]``.
+
+    Metric columns follow ``automaton.metric_ids``.
+    """
+    page_numbers, lengths, rows, cols, tf = keyword_counts(automaton, pages)
+    n_pages = len(page_numbers)
+    scores = np.zeros((n_pages, len(automaton.metric_ids)), dtype=np.float64)
+    if not len(tf):
+        return page_numbers, scores
+
+    df = np.bincount(cols, minlength=len(automaton.keywords))
+    idf = np.log1p((n_pages - df + 0.5) / (df + 0.5))
+    avgdl = lengths.mean() or 1.0
+    norm = k1 * (1 - b + b * lengths[rows] / avgdl)
+    weights = idf[cols] * tf * (k1 + 1) / (tf + norm)
+
+    # (page x keyword) @ (keyword x metric): repeat each nonzero once per
+    # metric listing its keyword, then scatter-add into the dense result.
+    indptr, metric_idx = _keyword_metric_incidence(automaton)
+    fanout = indptr[cols + 1] - indptr[cols]
+    out_rows = np.repeat(rows, fanout)
+    out_weights = np.repeat(weights, fanout)
+    starts = np.repeat(indptr[cols], fanout)
+    within = np.arange(len(out_rows)) - np.repeat(np.cumsum(fanout) - fanout, fanout)
+    np.add.at(scores, (out_rows, metric_idx[starts + within]), out_weights)
+    return page_numbers, scores
+
+
+def rank_pages(
+    automaton: KeywordAutomaton, pages: Iterable[Dict], top_k: int = 10
+) -> Dict[str, List[Tuple[int, float]]]:
+    """Return ``{metric_id: [(page, score), ...]}``, best first, at most ``top_k``.
+
+    Pages without any keyword of the metric are never listed.
+    """
+    page_numbers, scores = bm25_scores(automaton, pages)
+    ranked: Dict[str, List[Tuple[int, float]]] = {}
+    for j, metric_id in enumerate(automaton.metric_ids):
+        column = scores[:, j]
+        hit = np.nonzero(column > 0)[0]
+        # Stable sort on -score keeps page order among ties.
+        order = hit[np.argsort(-column[hit], kind="stable")][:top_k]
+        ranked[metric_id] = [(int(page_numbers[i]), float(column[i])) for i in order]
+    return ranked
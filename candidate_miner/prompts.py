@@ -9,60 +9,110 @@ CANDIDATE_SYSTEM = (
 )
 
 
-def build_candidate_payload(model: str, metric: Dict, page_text: str) -> Dict:
-    """Return request payload for candidate mining."""
-    user_content = {
+CANDIDATE_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "page": {"type": "integer"},
+        "score": {"type": "number"},
+        "category_pred": {
+            "type": "string",
+            "enum": ["quantitative", "discussion"],
+        },
+        "unit_pred": {"type": "string"},
+        "value": {"type": "string"},
+        "spans": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "x1": {"type": "number"},
+                    "y1": {"type": "number"},
+                    "x2": {"type": "number"},
+                    "y2": {"type": "number"},
+                },
+            },
+        },
+        "rationale": {"type": "string"},
+    },
+    "required": ["page", "score", "category_pred"],
+}
+
+
+def _metric_fields(metric: Dict) -> Dict:
+    return {
         "metric_code": metric.get("metric_code", ""),
         "metric_title": metric.get("metric_title", ""),
         "expected_category": metric.get("expected_category", ""),
         "expected_units": metric.get("expected_units", []),
-        "page_no": metric.get("page_no"),
+    }
+
+
+def _payload(model: str, system: str, user_content: Dict, name: str, schema: Dict) -> Dict:
+    return {
+        "model": model,
+        "input": [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user_content},
+        ],
+        "response_format": {"type": "json_schema", "json_schema": {"name": name, "schema": schema}},
+    }
+
+
+def build_candidate_payload(model: str, metric: Dict, page_text: str) -> Dict:
+    """Return request payload for candidate mining."""
+    user_content = {**_metric_fields(metric), "page_no": metric.get("page_no"), "page_text": page_text}
+    schema = {
+        "type": "object",
+        "properties": {"candidates": {"type": "array", "items": CANDIDATE_ITEM_SCHEMA}},
+        "required": ["candidates"],
+    }
+    return _payload(model, CANDIDATE_SYSTEM, user_content, "CandidateList", schema)
+
+
+BATCH_CANDIDATE_SYSTEM = (
+    CANDIDATE_SYSTEM + " The page is checked for several metrics at once: "
+    "return one entry per requested metric_code, with an empty candidates list "
+    "if the page has nothing for it."
+)
+
+
+def build_batch_candidate_payload(model: str, metrics: List[Dict], page_text: str) -> Dict:
+    """Return one request payload asking for candidates of all ``metrics`` on a page.
+
+    The page is sent once; ``page_no`` is taken from the first metric. Split
+    the response with :func:`split_batch_candidates`.
+    """
+    user_content = {
+        "metrics": [_metric_fields(m) for m in metrics],
+        "page_no": metrics[0].get("page_no") if metrics else None,
         "page_text": page_text,
     }
     schema = {
         "type": "object",
         "properties": {
-            "candidates": {
+            "metrics": {
                 "type": "array",
                 "items": {
                     "type": "object",
                     "properties": {
-                        "page": {"type": "integer"},
-                        "score": {"type": "number"},
-                        "category_pred": {
-                            "type": "string",
-                            "enum": ["quantitative", "discussion"],
-                        },
-                        "unit_pred": {"type": "string"},
-                        "value": {"type": "string"},
-                        "spans": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "x1": {"type": "number"},
-                                    "y1": {"type": "number"},
-                                    "x2": {"type": "number"},
-                                    "y2": {"type": "number"},
-                                },
-                            },
-                        },
-                        "rationale": {"type": "string"},
+                        "metric_code": {"type": "string", "enum": [m.get("metric_code", "") for m in metrics]},
+                        "candidates": {"type": "array", "items": CANDIDATE_ITEM_SCHEMA},
                     },
-                    "required": ["page", "score", "category_pred"],
+                    "required": ["metric_code", "candidates"],
                 },
             }
         },
-        "required": ["candidates"],
-    }
-    return {
-        "model": model,
-        "input": [
-            {"role": "system", "content": CANDIDATE_SYSTEM},
-            {"role": "user", "content": user_content},
-        ],
-        "response_format": {"type": "json_schema", "json_schema": {"name": "CandidateList", "schema": schema}},
+        "required": ["metrics"],
     }
+    return _payload(model, BATCH_CANDIDATE_SYSTEM, user_content, "MetricCandidateLists", schema)
+
+
+def split_batch_candidates(data: Dict, metrics: List[Dict]) -> List[List[Dict]]:
+    """Fan a batched response out to one candidate list per metric, in order."""
+    by_code: Dict[str, List[Dict]] = {}
+    for entry in data.get("metrics", []):
+        by_code.setdefault(entry.get("metric_code", ""), []).extend(entry.get("candidates", []))
+    return [by_code.get(m.get("metric_code", ""), []) for m in metrics]
 
 
 DRAFT_SYSTEM = (
@@ -14,7 +14,9 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QHBoxLayout,
                              QTextEdit, QFrame, QListWidgetItem)
 from PyQt5.QtCore import Qt, QRect, QPoint
 from PyQt5.QtGui import QPixmap, QPainter, QPen, QColor, QMouseEvent
-from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from page_store import open_page_store
 
 class DraggableImageLabel(QLabel):
     """드래그 가능한 이미지 라벨"""
@@ -838,37 +840,38 @@ class ESGAnnotationApp(QMainWindow):
     def count_total_pages(self):
         """총 페이지 수 계산"""
         page_dir = os.path.join(self.project_dir, "pages")
-        if os.path.exists(page_dir):
-            png_files = [f for f in os.listdir(page_dir) if f.endswith('.png')]
-            return len(png_files)
-        return 0
+        self.pages_meta = []
+        if not os.path.exists(page_dir):
+            return 0
+        self.pages_meta = open_page_store(page_dir)
+        if len(self.pages_meta):
+            return len(self.pages_meta)
+        # 메타데이터가 없는 프로젝트: PNG 파일 수로 계산
+        png_files = [f for f in os.listdir(page_dir) if f.endswith('.png')]
+        return len(png_files)
     
     def load_current_page(self):
         """현재 페이지 로드"""
-        image_path = os.path.join(self.project_dir, "pages", f"{self.current_page}.png")
+        page_dir = os.path.join(self.project_dir, "pages")
+        # 표시 최대 크기
+        max_width, max_height = 1200, 1600
+        if self.current_page <= len(self.pages_meta):
+            # 박스는 라벨 픽셀 좌표로 저장되므로 항상 화면용(dpi) 이미지를 사용해
+            # 기존 주석과 같은 배율을 유지한다 (확대용 이미지는 쓰지 않음)
+            meta = self.pages_meta[self.current_page - 1]
+            screen = (meta.get("images") or {}).get("screen")
+            image_path = os.path.join(page_dir, screen["path"] if screen else os.path.basename(meta["image_path"]))
+        else:
+            image_path = os.path.join(page_dir, f"{self.current_page}.png")
         if os.path.exists(image_path):
             try:
-                # PIL로 이미지 로드 - 고해상도 유지
-                pil_image = Image.open(image_path)
-                original_size = pil_image.size
-                print(f"원본 이미지 크기: {original_size}")
-                
-                # 더 큰 최대 크기로 설정 (해상도 대폭 향상)
-                max_width, max_height = 1200, 1600  # 기존 600x800 → 1200x1600
-                
+                pixmap = QPixmap(image_path)
+                print(f"원본 이미지 크기: {pixmap.width()}x{pixmap.height()}")
+
                 # 원본이 작으면 그대로, 크면 고품질 리샘플링
-                if original_size[0] > max_width or original_size[1] > max_height:
-                    pil_image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-                    print(f"리사이징된 크기: {pil_image.size}")
-                else:
-                    print("원본 크기 그대로 사용 (더 선명함)")
-                
-                # PNG로 최고 품질 저장
-                temp_path = f"temp_image_{self.current_page}.png"
-                pil_image.save(temp_path, "PNG", compress_level=0)  # 압축 없음 = 최고 품질
-                
-                # QPixmap으로 로드
-                pixmap = QPixmap(temp_path)
+                if pixmap.width() > max_width or pixmap.height() > max_height:
+                    pixmap = pixmap.scaled(max_width, max_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    print(f"리사이징된 크기: {pixmap.width()}x{pixmap.height()}")
                 
                 # 이미지가 너무 크면 QLabel 크기 조정
                 if pixmap.width() > 1000 or pixmap.height() > 800:
@@ -877,10 +880,6 @@ class ESGAnnotationApp(QMainWindow):
                 self.image_label.setPixmap(pixmap)
                 self.image_label.resize(pixmap.size())
                 
-                # 임시 파일 삭제
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-                
                 # 페이지 라벨 업데이트
                 self.page_label.setText(f"페이지 {self.current_page}/{self.total_pages}")
                 
@@ -894,7 +893,7 @@ class ESGAnnotationApp(QMainWindow):
                 # 이 페이지와 관련된 메트릭 표시 업데이트
                 self.update_likely_metrics_display()
 
-                print(f"페이지 {self.current_page} 로드 성공: {pil_image.size}")
+                print(f"페이지 {self.current_page} 로드 성공: {pixmap.width()}x{pixmap.height()}")
             except Exception as e:
                 print(f"페이지 {self.current_page} 로드 실패: {e}")
                 self.image_label.setText(f"페이지 {self.current_page} 로드 실패")
@@ -18,6 +18,7 @@ def main():
     parser.add_argument("--data_dir", required=True)
     parser.add_argument("--project", required=True, help="project workspace directory")
     parser.add_argument("--ocr", action="store_true", help="run OCR on pages")
+    parser.add_argument("--workers", type=int, default=1, help="parallel preprocessing processes (0 = all CPUs)")
     args = parser.parse_args()
 
     pdfs = list_pdfs(args.data_dir)
@@ -40,7 +41,7 @@ def main():
 
             shutil.copy(base_map, project_dir)
 
-    pages_meta = preprocess_pdf(pdf_path, project_dir, ocr=args.ocr)
+    pages_meta = preprocess_pdf(pdf_path, project_dir, ocr=args.ocr, workers=args.workers or None)
 
     # load config
     config_path = os.path.join(os.path.dirname(__file__), "config", "config.json")
@@ -0,0 +1,195 @@
+"""Append-only page metadata store with random access by page number.
+
+Preprocessing writes one JSON record per page to ``pages/pages.jsonl`` as
+soon as the page is finished, and a fixed-width binary index
+``pages/pages.idx`` holding ``(offset, length)`` of page N at slot N-1.
+Readers seek straight to the record they need instead of parsing the whole
+document's metadata. A writer streams to ``.tmp`` files and only replaces the
+previous store on :meth:`PageStoreWriter.close`, so readers never see an
+index that points into a different records file.
+"""
+from __future__ import annotations
+
+import json
+import os
+import struct
+from typing import Dict, Iterator, List, Optional, Sequence
+
+RECORDS_NAME = "pages.jsonl"
+INDEX_NAME = "pages.idx"
+LEGACY_NAME = "metadata.json"
+
+_SLOT = struct.Struct("<qq")  # byte offset, byte length; offset -1 = missing
+
+
+class PageStoreWriter:
+    """Stream page records to disk; pages may arrive in any order."""
+
+    def __init__(self, pages_dir: str):
+        self.pages_dir = pages_dir
+        self._records_tmp = os.path.join(pages_dir, RECORDS_NAME + ".tmp")
+        self._f = open(self._records_tmp, "wb")
+        self._slots: Dict[int, tuple] = {}
+
+    def write(self, record: Dict) -> None:
+        line = json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+        offset = self._f.tell()
+        self._f.write(line)
+        self._slots[int(record["page"])] = (offset, len(line))
+
+    def close(self) -> None:
+        """Flush records, write the index and replace the previous store."""
+        if self._f.closed:
+            return
+        self._f.close()
+        n_pages = max(self._slots, default=0)
+        index_tmp = os.path.join(self.pages_dir, INDEX_NAME + ".tmp")
+        with open(index_tmp, "wb") as f:
+            for page in range(1, n_pages + 1):
+                f.write(_SLOT.pack(*self._slots.get(page, (-1, 0))))
+        index_path = os.path.join(self.pages_dir, INDEX_NAME)
+        # Drop the old index first: between the two renames the store is
+        # missing rather than an old index over new records.
+        if os.path.exists(index_path):
+            os.remove(index_path)
+        os.replace(self._records_tmp, os.path.join(self.pages_dir, RECORDS_NAME))
+        os.replace(index_tmp, index_path)
+
+    def abort(self) -> None:
+        """Discard the records written so far and keep the previous store."""
+        if self._f.closed:
+            return
+        self._f.close()
+        os.remove(self._records_tmp)
+
+    def __enter__(self) -> "PageStoreWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class PageStore(Sequence):
+    """Lazy, read-only view of a project's page metadata.
+
+    Behaves like the list ``preprocess_pdf`` used to return (0-based
+    indexing, ``len``, iteration) but only reads the records it is asked for.
+    Use :meth:`page` for 1-based page numbers.
+    """
+
+    def __init__(self, pages_dir: str):
+        self.pages_dir = pages_dir
+        self._records_path = os.path.join(pages_dir, RECORDS_NAME)
+        self._index_path = os.path.join(pages_dir, INDEX_NAME)
+        self._count = os.path.getsize(self._index_path) // _SLOT.size
+        self._records = None
+        self._index = None
+
+    @staticmethod
+    def exists(pages_dir: str) -> bool:
+        return os.path.exists(os.path.join(pages_dir, RECORDS_NAME)) and os.path.exists(
+            os.path.join(pages_dir, INDEX_NAME)
+        )
+
+    def _open(self) -> None:
+        if self._records is None:
+            self._records = open(self._records_path, "rb")
+            self._index = open(self._index_path, "rb")
+
+    def close(self) -> None:
+        if self._records is not None:
+            self._records.close()
+            self._index.close()
+            self._records = self._index = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def page(self, number: int) -> Optional[Dict]:
+        """Return metadata of 1-based page ``number`` (``None`` if absent)."""
+        if not 1 <= number <= self._count:
+            return None
+        self._open()
+        self._index.seek((number - 1) * _SLOT.size)
+        offset, length = _SLOT.unpack(self._index.read(_SLOT.size))
+        if offset < 0:
+            return None
+        self._records.seek(offset)
+        return json.loads(self._records.read(length))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self.page(index + 1)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for number in range(1, self._count + 1):
+            record = self.page(number)
+            if record is not None:
+                yield record
+
+
+def project_dirs(projects_dir: str) -> List[str]:
+    """Project workspaces under ``projects_dir``: directories with a ``pages`` folder."""
+    return sorted(
+        os.path.join(projects_dir, name)
+        for name in os.listdir(projects_dir)
+        if os.path.isdir(os.path.join(projects_dir, name, "pages"))
+    )
+
+
+def open_page_store(pages_dir: str) -> Sequence[Dict]:
+    """Return page metadata of ``pages_dir``.
+
+    Falls back to the list in a legacy ``metadata.json`` for projects
+    preprocessed before the streaming store existed.
+    """
+    if PageStore.exists(pages_dir):
+        return PageStore(pages_dir)
+    legacy = os.path.join(pages_dir, LEGACY_NAME)
+    if os.path.exists(legacy):
+        with open(legacy, "r", encoding="utf-8") as f:
+            pages: List[Dict] = json.load(f)
+        return pages
+    return []
+
+
+def page_text(record: Dict) -> str:
+    """Searchable text of a page: the text layer plus any OCR output."""
+    ocr = record.get("ocr") or ""
+    return record.get("text", "") + ("\n" + ocr if ocr else "")
+
+
+def load_layout(record: Dict, pages_dir: str) -> Dict:
+    """Return the block/line layout and reading order of a page record.
+
+    Empty for records preprocessed before layouts were stored.
+    """
+    rel = record.get("layout")
+    if not rel:
+        return {"blocks": [], "reading_order": []}
+    with open(os.path.join(pages_dir, rel), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def best_image(record: Dict, pages_dir: str, max_width: int, max_height: int) -> str:
+    """Return the path of the pyramid level best suited to a display box.
+
+    Picks the smallest level that still fills ``max_width`` x ``max_height``
+    (so it is only ever scaled down), or the largest level when none does.
+    Records without an ``images`` pyramid fall back to the file named by
+    ``image_path``. Paths are resolved against ``pages_dir``.
+    """
+    levels = sorted(
+        (record.get("images") or {}).values(), key=lambda level: level["width"] * level["height"]
+    )
+    for level in levels:
+        if level["width"] >= max_width or level["height"] >= max_height:
+            return os.path.join(pages_dir, level["path"])
+    if levels:
+        return os.path.join(pages_dir, levels[-1]["path"])
+    return os.path.join(pages_dir, os.path.basename(record["image_path"]))
@@ -0,0 +1,183 @@
+"""Table detection and numeric cell extraction for report pages.
+
+ESG figures are mostly reported in tables, where the flat page text loses
+which row and column a number belongs to. Preprocessing runs PyMuPDF's
+``Page.find_tables`` and stores every table as ``pages/tables/<n>.json``::
+
+    [{"bbox": [...], "rows": 21, "cols": 9, "header_rows": 2,
+      "cells": [{"row", "col", "text", "value", "unit", "bbox",
+                 "row_header", "col_header"}, ...]}]
+
+``value`` is the cell's number as a float (``None`` for text cells), boxes
+are in PDF coordinates like the word geometry. ``row_header`` joins the text
+cells left of the cell in its row, ``col_header`` the header rows above it,
+so "row label matches a keyword, column is the reporting year" becomes a
+dictionary lookup (:func:`find_cells`).
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+
+from utils import UNIT_RE, ensure_dir, extract_numbers, normalize_text
+
+TABLES_DIR = "tables"
+YEAR_RE = re.compile(r"(?:19|20)\d{2}년?")
+
+
+def _clean(text: Optional[str]) -> str:
+    return " ".join((text or "").split())
+
+
+def _header_unit(*headers: str) -> str:
+    for header in headers:
+        m = UNIT_RE.search(header)
+        if m:
+            return m.group(0)
+    return ""
+
+
+def _cell_number(text: str):
+    """Return the cell's ``NumberToken`` if the cell holds just one number."""
+    tokens = extract_numbers(text)
+    if len(tokens) != 1:
+        return None
+    token = tokens[0]
+    rest = (text[: token.start] + text[token.end :]).replace(token.unit, "", 1)
+    return token if not rest.strip(" -+()△▲▽▼") else None
+
+
+def _is_data(text: Optional[str]) -> bool:
+    """True for numeric cells other than a bare year ("2023"), which labels a column."""
+    if text is None:
+        return False
+    token = _cell_number(text)
+    return token is not None and not YEAR_RE.fullmatch(text.strip())
+
+
+def _table_cells(grid: List[List[Optional[str]]], boxes: List[List[Optional[tuple]]]) -> Dict:
+    """Build cell records with row/column headers from an extracted grid.
+
+    Merged cells come out of PyMuPDF as ``None``: in header rows they are
+    filled from the left (a spanning column header), in data rows from above
+    (a spanning row label).
+    """
+    texts = [[_clean(c) if c is not None else None for c in row] for row in grid]
+    header_rows = 0
+    while header_rows < len(texts) - 1 and not any(_is_data(c) for c in texts[header_rows]):
+        header_rows += 1
+
+    filled = []
+    for r, row in enumerate(texts):
+        out = []
+        for c, text in enumerate(row):
+            if text is None:
+                if r < header_rows:
+                    text = out[c - 1] if c else ""
+                else:
+                    text = filled[r - 1][c] if r > header_rows else ""
+            out.append(text)
+        filled.append(out)
+
+    n_cols = max((len(row) for row in filled), default=0)
+    col_headers = []
+    for c in range(n_cols):
+        parts: List[str] = []
+        for r in range(header_rows):
+            text = filled[r][c] if c < len(filled[r]) else ""
+            if text and text not in parts:
+                parts.append(text)
+        col_headers.append(" / ".join(parts))
+
+    cells = []
+    for r in range(header_rows, len(texts)):
+        for c, text in enumerate(texts[r]):
+            if text is None:
+                continue
+            token = _cell_number(text)
+            labels: List[str] = []
+            for left in filled[r][:c]:
+                if left and left not in labels and _cell_number(left) is None:
+                    labels.append(left)
+            row_header = " / ".join(labels)
+            col_header = col_headers[c] if c < n_cols else ""
+            box = boxes[r][c] if r < len(boxes) and c < len(boxes[r]) else None
+            cells.append(
+                {
+                    "row": r,
+                    "col": c,
+                    "text": text,
+                    "value": token.value if token else None,
+                    # Units are usually stated once in a header: "배출량 (tCO2e)".
+                    "unit": (token.unit or _header_unit(col_header, row_header)) if token else "",
+                    "bbox": [round(v, 2) for v in box] if box else None,
+                    "row_header": row_header,
+                    "col_header": col_header,
+                }
+            )
+    return {"header_rows": header_rows, "cells": cells}
+
+
+def extract_tables(page) -> List[Dict]:
+    """Detect the tables on a PyMuPDF ``page`` and return their cell records."""
+    tables = []
+    for table in page.find_tables().tables:
+        grid = table.extract()
+        boxes = [list(row.cells) for row in table.rows]
+        tables.append(
+            {
+                "bbox": [round(v, 2) for v in table.bbox],
+                "rows": table.row_count,
+                "cols": table.col_count,
+                **_table_cells(grid, boxes),
+            }
+        )
+    return tables
+
+
+def write_tables(pages_dir: str, page: int, tables: List[Dict]) -> str:
+    """Store ``tables`` for ``page``; returns the path relative to ``pages_dir``."""
+    rel = f"{TABLES_DIR}/{page}.json"
+    path = os.path.join(pages_dir, rel)
+    ensure_dir(os.path.dirname(path))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(tables, f, ensure_ascii=False)
+    return rel
+
+
+def load_tables(record: Dict, pages_dir: str) -> List[Dict]:
+    """Return the tables of a page record (``[]`` if none were extracted)."""
+    rel = record.get("tables")
+    if not rel:
+        return []
+    path = os.path.join(pages_dir, rel)
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def find_cells(
+    tables: List[Dict], keywords: Iterable[str], column: Optional[str] = None
+) -> List[Dict]:
+    """Numeric cells whose row header contains one of ``keywords``.
+
+    With ``column`` (e.g. a reporting year ``"2023"``) only cells whose
+    column header contains it are returned. Matching uses
+    ``utils.normalize_text`` on both sides.
+    """
+    needles = [normalize_text(k) for k in keywords if k]
+    column = normalize_text(column) if column else None
+    found = []
+    for table in tables:
+        for cell in table["cells"]:
+            if cell["value"] is None:
+                continue
+            if column and column not in normalize_text(cell["col_header"]):
+                continue
+            row = normalize_text(cell["row_header"])
+            if any(n in row for n in needles):
+                found.append(cell)
+    return found
@@ -1,57 +1,767 @@
 """PDF preprocessing utilities using PyMuPDF and optional OCR."""
 import hashlib
 import json
+import logging
 import os
-from typing import List
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from collections import deque
+from itertools import zip_longest
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import fitz  # PyMuPDF
 from PIL import Image
 
-from utils import ensure_dir
+from page_store import PageStore, PageStoreWriter
+from page_tables import TABLES_DIR, extract_tables, write_tables
+from text_index import build_text_index
+from utils import ensure_dir, read_json
+from word_geometry import WORDS_DIR, write_words
 
 try:
     import pytesseract
 except Exception:  # pragma: no cover
     pytesseract = None
 
+logger = logging.getLogger(__name__)
 
-def preprocess_pdf(pdf_path: str, project_dir: str, ocr: bool = False) -> List[dict]:
-    """Convert PDF into page PNGs and extract text.
-
-    Returns list of metadata dictionaries for each page.
-    """
-    ensure_dir(project_dir)
-    pages_dir = os.path.join(project_dir, "pages")
-    ensure_dir(pages_dir)
-
-    doc = fitz.open(pdf_path)
-    meta: List[dict] = []
-    for i, page in enumerate(doc, start=1):
-        pix = page.get_pixmap()
-        img_path = os.path.join(pages_dir, f"{i}.png")
-        pix.save(img_path)
-        text = page.get_text("text")
-        ocr_text = ""
-        if ocr and pytesseract is not None:
-            try:
-                ocr_text = pytesseract.image_to_string(Image.open(img_path))
-            except Exception:
-                ocr_text = ""
-        meta.append(
+# Each worker receives several small page ranges rather than one large slice so
+# that pages with heavy images do not leave the other workers idle at the end.
+CHUNKS_PER_WORKER = 4
+# Upper bound on pages per range; the manifest is saved after every range, so
+# this also bounds how much work an interrupted run loses.
+MAX_CHUNK_PAGES = 16
+# Page ranges submitted to a process pool ahead of the consumer, per worker.
+# Finished ranges hold their page records until consumed, so this bounds memory.
+IN_FLIGHT_PER_WORKER = 2
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 2
+
+# Supported pyramid formats (PIL format name -> file extension).
+IMAGE_FORMATS = {"png": "png", "webp": "webp", "jpeg": "jpg"}
+# Settings that change the rendered images; OCR settings are excluded so that
+# turning OCR on does not invalidate existing renders.
+RENDER_KEYS = ("dpi", "zoom_dpi", "thumb_width", "image_format", "quality")
+
+# Pages whose text layer has fewer non-whitespace characters than this are
+# treated as image-only and sent to OCR.
+OCR_MIN_CHARS = 50
+OCR_CACHE_DIR = "ocr_cache"
+# Resolution pages are rendered at for OCR when no zoom level is written.
+OCR_DPI = 144
+LAYOUT_DIR = "layout"
+
+
+def page_ranges(page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """Split ``[0, page_count)`` into contiguous ``(start, stop)`` ranges."""
+    n_chunks = max(workers * CHUNKS_PER_WORKER, -(-page_count // MAX_CHUNK_PAGES))
+    n_chunks = max(1, min(page_count, n_chunks))
+    size, extra = divmod(page_count, n_chunks)
+    ranges = []
+    start = 0
+    for i in range(n_chunks):
+        stop = start + size + (1 if i < extra else 0)
+        if stop > start:
+            ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _page_fingerprint(doc, page, settings: Dict) -> str:
+    """Hash of everything that determines a page's rendered output.
+
+    Covers the content stream, page geometry, embedded image streams and the
+    render settings, so unchanged pages survive edits elsewhere in the PDF.
+    """
+    h = hashlib.sha256()
+    render = {k: settings[k] for k in RENDER_KEYS}
+    h.update(json.dumps(render, sort_keys=True).encode("utf-8"))
+    h.update(repr(tuple(page.rect)).encode("ascii"))
+    h.update(page.read_contents())
+    for img in page.get_images(full=True):
+        h.update(doc.xref_stream_raw(img[0]) or b"")
+    return h.hexdigest()
+
+
+def render_settings(
+    dpi: int = 72,
+    zoom_dpi: int = 0,
+    thumb_width: int = 200,
+    image_format: str = "png",
+    quality: int = 85,
+) -> Dict:
+    """Return the image pyramid settings recorded in the manifest.
+
+    Every page gets a screen level (``dpi``) and a thumbnail ``thumb_width``
+    pixels wide; the high-resolution zoom level is only written when
+    ``zoom_dpi`` is set. ``quality`` applies to lossy formats (``webp``,
+    ``jpeg``).
+    """
+    image_format = image_format.lower()
+    if image_format == "jpg":
+        image_format = "jpeg"
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"unsupported image format: {image_format}")
+    return {
+        "dpi": dpi,
+        "zoom_dpi": max(zoom_dpi, dpi) if zoom_dpi else 0,
+        "thumb_width": thumb_width,
+        "image_format": image_format,
+        "quality": quality,
+    }
+
+
+def _level_paths(i: int, image_format: str) -> Dict[str, str]:
+    """Pyramid image paths of page ``i``, relative to the pages directory."""
+    ext = IMAGE_FORMATS[image_format]
+    # The screen level keeps the historical pages/<n>.<ext> location.
+    return {
+        "thumb": f"thumb/{i}.{ext}",
+        "screen": f"{i}.{ext}",
+        "zoom": f"zoom/{i}.{ext}",
+    }
+
+
+def _level_scales(page, settings: Dict) -> Dict[str, float]:
+    """Render scale (pixels per PDF point) of each pyramid level."""
+    screen = settings["dpi"] / 72
+    width, height = page.rect.width, page.rect.height
+    # Thumbnails fit thumb_width x 4*thumb_width and are never larger than the screen level.
+    thumb = min(screen, settings["thumb_width"] / width, 4 * settings["thumb_width"] / height)
+    scales = {"thumb": thumb, "screen": screen}
+    if settings["zoom_dpi"]:
+        scales["zoom"] = settings["zoom_dpi"] / 72
+    return scales
+
+
+def _save_pixmap(pix, path: str, settings: Dict) -> None:
+    """Encode ``pix`` with MuPDF; WebP, which MuPDF cannot write, goes through PIL."""
+    if settings["image_format"] == "png":
+        pix.save(path, output="png")
+    elif settings["image_format"] == "jpeg":
+        pix.save(path, output="jpeg", jpg_quality=settings["quality"])
+    else:
+        Image.frombytes("RGB", (pix.width, pix.height), pix.samples).save(
+            path, "WEBP", quality=settings["quality"]
+        )
+
+
+def _render_pyramid(page, pages_dir: str, paths: Dict[str, str], settings: Dict) -> Dict[str, Dict]:
+    """Render and save every pyramid level, each at its own resolution.
+
+    Returns ``{level: {path, width, height, bytes}}`` with paths relative to
+    ``pages_dir``.
+    """
+    images = {}
+    for level, scale in _level_scales(page, settings).items():
+        pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+        path = os.path.join(pages_dir, paths[level])
+        ensure_dir(os.path.dirname(path))
+        _save_pixmap(pix, path, settings)
+        images[level] = {
+            "path": paths[level],
+            "width": pix.width,
+            "height": pix.height,
+            "bytes": os.path.getsize(path),
+        }
+    return images
+
+
+def _render_image(page, dpi: int) -> Image.Image:
+    pix = page.get_pixmap(dpi=dpi)
+    return Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
+
+def _extract_text_views(page) -> Tuple[str, list, Dict]:
+    """Parse the page once into a ``TextPage`` and derive every text view.
+
+    Returns plain text, ``get_text("words")`` tuples and a layout dict with
+    ``blocks`` (bbox and lines with bbox/text) and ``reading_order`` (block
+    numbers sorted top-to-bottom, left-to-right). Block and line numbers in
+    the words match the layout because all views share the same TextPage.
+    """
+    tp = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+    text = page.get_text("text", textpage=tp)
+    words = page.get_text("words", textpage=tp)
+    blocks = []
+    for block in page.get_text("dict", textpage=tp)["blocks"]:
+        lines = [
             {
-                "page": i,
-                "width": pix.width,
-                "height": pix.height,
-                "text": text,
-                "ocr": ocr_text,
-                "image_path": img_path,
-                "tokens": text.split(),
+                "bbox": [round(v, 2) for v in line["bbox"]],
+                "text": "".join(span["text"] for span in line["spans"]),
             }
+            for line in block.get("lines", [])
+        ]
+        blocks.append(
+            {"number": block["number"], "bbox": [round(v, 2) for v in block["bbox"]], "lines": lines}
+        )
+    reading_order = [b[5] for b in page.get_text("blocks", textpage=tp, sort=True)]
+    return text, words, {"blocks": blocks, "reading_order": reading_order}
+
+
+def _write_layout(pages_dir: str, page: int, layout: Dict) -> str:
+    rel = f"{LAYOUT_DIR}/{page}.json"
+    path = os.path.join(pages_dir, rel)
+    ensure_dir(os.path.dirname(path))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(layout, f, ensure_ascii=False)
+    return rel
+
+
+def needs_ocr(text: str, min_chars: int = OCR_MIN_CHARS) -> bool:
+    """True if a page's text layer is too sparse to be usable."""
+    return sum(len(part) for part in text.split()) < min_chars
+
+
+def _ocr_image(img: Image.Image, cache_dir: str) -> Optional[str]:
+    """OCR ``img``, caching the result under the hash of its pixels.
+
+    Returns ``None`` if tesseract fails; failures are not cached.
+    """
+    h = hashlib.sha256()
+    h.update(f"{img.mode}{img.size}".encode("ascii"))
+    h.update(img.tobytes())
+    cache_path = os.path.join(cache_dir, h.hexdigest() + ".txt")
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return f.read()
+    try:
+        text = pytesseract.image_to_string(img)
+    except Exception as e:
+        logger.warning("OCR failed, will retry on the next run: %s", e)
+        return None
+    ensure_dir(cache_dir)
+    tmp = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, cache_path)
+    return text
+
+
+def _output_valid(entry: Optional[Dict], fingerprint: str, pages_dir: str) -> bool:
+    """True if ``entry`` describes an existing, complete render of this page."""
+    if not entry or entry.get("fingerprint") != fingerprint:
+        return False
+    try:
+        return all(
+            os.path.getsize(os.path.join(pages_dir, level["path"])) == level["bytes"]
+            for level in entry["images"].values()
+        )
+    except (OSError, KeyError):
+        return False
+
+
+def _iter_pages(
+    pdf_path: str,
+    pages_dir: str,
+    start: int,
+    stop: int,
+    settings: Dict,
+    previous: Dict[str, Dict],
+    ocr_workers: int = 2,
+) -> Iterator[Tuple[dict, Dict]]:
+    """Render and extract pages ``start`` to ``stop - 1`` (0-based).
+
+    Opens its own document handle so it can run inside a worker process.
+    Pages whose manifest entry in ``previous`` still matches are not
+    re-rendered. When OCR is enabled only text-poor pages are OCR'd, from a
+    render at ``zoom_dpi`` (``OCR_DPI`` without a zoom level), on a pool of
+    ``ocr_workers`` threads so that rendering continues while tesseract
+    runs. Yields
+    ``(page metadata, manifest entry)`` pairs in page order, each as soon as
+    the page and every page before it are finished.
+    """
+    pending: Deque[Tuple[dict, Dict, Optional[Future]]] = deque()
+    cache_dir = os.path.join(pages_dir, OCR_CACHE_DIR)
+    ocr_pool = ThreadPoolExecutor(max_workers=max(1, ocr_workers)) if settings["ocr"] else None
+    try:
+        with fitz.open(pdf_path) as doc:
+            for index in range(start, stop):
+                page = doc[index]
+                i = index + 1
+                text, words, layout = _extract_text_views(page)
+                n_words = write_words(pages_dir, i, words, text)
+                layout_path = _write_layout(pages_dir, i, layout)
+                want_ocr = settings["ocr"] and needs_ocr(text, settings["ocr_min_chars"])
+                fingerprint = _page_fingerprint(doc, page, settings)
+                entry = previous.get(str(i))
+                if not _output_valid(entry, fingerprint, pages_dir):
+                    paths = _level_paths(i, settings["image_format"])
+                    images = _render_pyramid(page, pages_dir, paths, settings)
+                    entry = {"fingerprint": fingerprint, "images": images}
+                else:
+                    entry = dict(entry)
+                tables_path = None
+                if settings["tables"]:
+                    tables_path = f"{TABLES_DIR}/{i}.json"
+                    if "tables" not in entry or not os.path.exists(os.path.join(pages_dir, tables_path)):
+                        tables = extract_tables(page)
+                        write_tables(pages_dir, i, tables)
+                        entry["tables"] = len(tables)
+                future = None
+                if want_ocr and "ocr" not in entry:
+                    image = _render_image(page, settings["zoom_dpi"] or OCR_DPI)
+                    future = ocr_pool.submit(_ocr_image, image, cache_dir)
+                images = {
+                    level: {k: v for k, v in info.items() if k != "bytes"}
+                    for level, info in entry["images"].items()
+                }
+                meta = {
+                    "page": i,
+                    "width": images["screen"]["width"],
+                    "height": images["screen"]["height"],
+                    "text": text,
+                    "ocr": entry.get("ocr", "") if want_ocr else "",
+                    "image_path": os.path.join(pages_dir, images["screen"]["path"]),
+                    "images": images,
+                    # PDF-space page size; word boxes are in these units.
+                    "page_size": [page.rect.width, page.rect.height],
+                    "words": f"{WORDS_DIR}/{i}.npy",
+                    "word_count": n_words,
+                    "layout": layout_path,
+                    "tables": tables_path,
+                    "table_count": entry.get("tables", 0) if tables_path else 0,
+                }
+                pending.append((meta, entry, future))
+                while pending and (pending[0][2] is None or pending[0][2].done()):
+                    yield _resolve_ocr(*pending.popleft())
+        while pending:
+            yield _resolve_ocr(*pending.popleft())
+    finally:
+        if ocr_pool is not None:
+            ocr_pool.shutdown(wait=True)
+
+
+def _resolve_ocr(meta: dict, entry: Dict, future: Optional[Future]) -> Tuple[dict, Dict]:
+    if future is not None:
+        text = future.result()
+        # A failed OCR leaves no "ocr" in the entry, so the next run retries it.
+        if text is not None:
+            meta["ocr"] = entry["ocr"] = text
+    return meta, entry
+
+
+def _process_pages(*task) -> List[Tuple[dict, Dict]]:
+    """Process a page range in a worker process; see :func:`_iter_pages`."""
+    return list(_iter_pages(*task))
+
+
+def _run_ranges(tasks: List[tuple], workers: int) -> Iterator[Iterable[Tuple[dict, Dict]]]:
+    """Yield the results of ``tasks`` range by range, in submission order.
+
+    Serially each range is a lazy iterator, so pages stream out one by one.
+    In parallel at most ``IN_FLIGHT_PER_WORKER * workers`` ranges are
+    submitted ahead of the consumer, and a range's results are released as
+    soon as it has been yielded, so memory stays bounded by the window
+    rather than the page count.
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield _iter_pages(*task)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        todo = iter(tasks)
+        window: Deque[Future] = deque()
+        try:
+            for task in todo:
+                window.append(pool.submit(_process_pages, *task))
+                if len(window) >= IN_FLIGHT_PER_WORKER * workers:
+                    break
+            # Ranges are contiguous and submitted in order, so collecting the
+            # futures in submission order yields pages in page order.
+            while window:
+                results = window.popleft().result()
+                task = next(todo, None)
+                if task is not None:
+                    window.append(pool.submit(_process_pages, *task))
+                yield results
+                del results
+        finally:
+            # Consumer stopped early: do not render ranges nobody will read.
+            for future in window:
+                future.cancel()
+
+
+def load_manifest(pages_dir: str) -> Dict:
+    """Return the preprocessing manifest of ``pages_dir`` (empty if absent)."""
+    manifest = read_json(os.path.join(pages_dir, MANIFEST_NAME))
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def _save_manifest(pages_dir: str, manifest: Dict) -> None:
+    # Write-then-rename so an interrupted run never leaves a truncated file.
+    path = os.path.join(pages_dir, MANIFEST_NAME)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _pdf_identity(pdf_path: str, manifest: Dict) -> Dict:
+    """Return size, mtime and sha256 of the PDF.
+
+    The hash is reused from ``manifest`` when size and mtime are unchanged,
+    which keeps re-opening a processed project from re-reading the PDF.
+    """
+    st = os.stat(pdf_path)
+    ident = {"pdf_size": st.st_size, "pdf_mtime_ns": st.st_mtime_ns}
+    if all(manifest.get(k) == v for k, v in ident.items()) and manifest.get("pdf_sha256"):
+        ident["pdf_sha256"] = manifest["pdf_sha256"]
+    else:
+        ident["pdf_sha256"] = pdf_sha256(pdf_path)
+    return ident
+
+
+class _DocumentJob:
+    """Preprocessing state of one PDF: manifest, page range tasks and store.
+
+    Results of the tasks may be fed to :meth:`add` in any order, so the tasks
+    of several documents can share one worker pool.
+    """
+
+    def __init__(
+        self, pdf_path: str, project_dir: str, settings: Dict, workers: int, ocr_workers: int
+    ):
+        self.pdf_path = pdf_path
+        self.project_dir = project_dir
+        ensure_dir(project_dir)
+        self.pages_dir = os.path.join(project_dir, "pages")
+        ensure_dir(self.pages_dir)
+        self.tasks: List[tuple] = []
+        self.page_count = 0
+        self.settings = settings
+        # Pages that need OCR but have no result yet (tesseract failed).
+        self.ocr_missing = 0
+        self._writer: Optional[PageStoreWriter] = None
+
+        manifest = load_manifest(self.pages_dir)
+        ident = _pdf_identity(pdf_path, manifest)
+        self.up_to_date = bool(
+            manifest.get("complete")
+            and manifest.get("pdf_sha256") == ident["pdf_sha256"]
+            and manifest.get("settings") == settings
+            and PageStore.exists(self.pages_dir)
         )
-    meta_path = os.path.join(pages_dir, "metadata.json")
-    with open(meta_path, "w", encoding="utf-8") as f:
-        json.dump(meta, f, indent=2, ensure_ascii=False)
-    return meta
+        if self.up_to_date:
+            if manifest.get("pdf_mtime_ns") != ident["pdf_mtime_ns"]:
+                manifest.update(ident)
+                _save_manifest(self.pages_dir, manifest)
+            self.page_count = manifest.get("page_count", 0)
+            return
+
+        previous = manifest.get("pages", {})
+        with fitz.open(pdf_path) as doc:
+            self.page_count = doc.page_count
+        self.manifest = {
+            "version": MANIFEST_VERSION,
+            **ident,
+            "settings": settings,
+            "page_count": self.page_count,
+            "complete": False,
+            "pages": previous,
+        }
+        _save_manifest(self.pages_dir, self.manifest)
+
+        for start, stop in page_ranges(self.page_count, workers):
+            prev = {str(i): previous[str(i)] for i in range(start + 1, stop + 1) if str(i) in previous}
+            self.tasks.append((pdf_path, self.pages_dir, start, stop, settings, prev, ocr_workers))
+
+    def start(self) -> None:
+        """Open the page store writer; called when the first range is submitted."""
+        if self._writer is None:
+            self._writer = PageStoreWriter(self.pages_dir)
+
+    def add_page(self, page_meta: dict, entry: Dict) -> None:
+        """Record one finished page; persisted by the next :meth:`checkpoint`."""
+        self._writer.write(page_meta)
+        self.manifest["pages"][str(page_meta["page"])] = entry
+        if (
+            self.settings["ocr"]
+            and "ocr" not in entry
+            and needs_ocr(page_meta["text"], self.settings["ocr_min_chars"])
+        ):
+            self.ocr_missing += 1
+
+    def checkpoint(self) -> None:
+        _save_manifest(self.pages_dir, self.manifest)
+
+    def add(self, results: Iterable[Tuple[dict, Dict]]) -> None:
+        """Record the output of one page range task."""
+        for page_meta, entry in results:
+            self.add_page(page_meta, entry)
+        self.checkpoint()
+
+    def finish(self) -> PageStore:
+        """Close the page store, index its text and mark the manifest complete.
+
+        If OCR failed on any page the manifest stays incomplete, so the next
+        run re-OCRs those pages (renders that are still valid are kept).
+        """
+        if not self.up_to_date:
+            self.start()
+            self._writer.close()
+            build_text_index(self.pages_dir)
+            # Drop entries for pages that no longer exist in the PDF.
+            self.manifest["pages"] = {
+                k: v for k, v in self.manifest["pages"].items() if int(k) <= self.page_count
+            }
+            self.manifest["complete"] = not self.ocr_missing
+            _save_manifest(self.pages_dir, self.manifest)
+        return PageStore(self.pages_dir)
+
+    def abort(self) -> None:
+        """Discard the unfinished page store; the previous one and the
+        incomplete manifest stay for resume."""
+        if self._writer is not None:
+            self._writer.abort()
+
+
+def _settings(
+    ocr: bool = False,
+    dpi: int = 72,
+    zoom_dpi: int = 0,
+    thumb_width: int = 200,
+    image_format: str = "png",
+    quality: int = 85,
+    ocr_min_chars: int = OCR_MIN_CHARS,
+    tables: bool = False,
+) -> Dict:
+    settings = render_settings(dpi, zoom_dpi, thumb_width, image_format, quality)
+    settings["ocr"] = bool(ocr and pytesseract is not None)
+    settings["ocr_min_chars"] = ocr_min_chars
+    settings["tables"] = bool(tables)
+    return settings
+
+
+def iter_preprocess_pdf(
+    pdf_path: str,
+    project_dir: str,
+    ocr: bool = False,
+    workers: Optional[int] = 1,
+    dpi: int = 72,
+    zoom_dpi: int = 0,
+    thumb_width: int = 200,
+    image_format: str = "png",
+    quality: int = 85,
+    ocr_min_chars: int = OCR_MIN_CHARS,
+    ocr_workers: int = 2,
+    tables: bool = False,
+) -> Iterator[dict]:
+    """Generator form of :func:`preprocess_pdf`.
+
+    Yields each page's metadata, in page order, as soon as the page is
+    finished (with ``workers`` > 1, as soon as its page range is), so
+    callers can mine or map pages while later pages are still rendering and
+    memory stays independent of page count. An up-to-date project yields
+    straight from the page store. Closing the generator early leaves the
+    manifest incomplete, so the next run resumes.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    settings = _settings(ocr, dpi, zoom_dpi, thumb_width, image_format, quality, ocr_min_chars, tables)
+    job = _DocumentJob(pdf_path, project_dir, settings, workers, ocr_workers)
+    if job.up_to_date:
+        yield from job.finish()
+        return
+    job.start()
+    try:
+        for results in _run_ranges(job.tasks, workers):
+            for page_meta, entry in results:
+                job.add_page(page_meta, entry)
+                yield page_meta
+            job.checkpoint()
+    except BaseException:
+        job.abort()
+        raise
+    job.finish()
+
+
+def preprocess_pdf(
+    pdf_path: str,
+    project_dir: str,
+    ocr: bool = False,
+    workers: Optional[int] = 1,
+    dpi: int = 72,
+    zoom_dpi: int = 0,
+    thumb_width: int = 200,
+    image_format: str = "png",
+    quality: int = 85,
+    ocr_min_chars: int = OCR_MIN_CHARS,
+    ocr_workers: int = 2,
+    tables: bool = False,
+) -> Sequence[dict]:
+    """Convert PDF into page images and extract text.
+
+    Every page gets a thumbnail and a screen-size image (``dpi``) in
+    ``image_format``, plus a high-resolution zoom image when ``zoom_dpi`` is
+    set; their
+    paths (relative to ``pages/``) and sizes are recorded under ``images`` in
+    the page metadata so viewers can load the level they display (see
+    ``page_store.best_image``).
+
+    With ``ocr`` only pages whose text layer has fewer than ``ocr_min_chars``
+    characters are OCR'd, on ``ocr_workers`` threads per worker process;
+    results are cached in ``pages/ocr_cache`` by page image hash.
+
+    With ``tables`` (off by default: ``find_tables`` costs several times
+    the rendering) every page's tables are detected and their cells (text,
+    parsed number, box, row and column headers) stored in
+    ``pages/tables/<n>.json`` (see :mod:`page_tables`); pages whose manifest
+    entry is still valid keep their stored tables.
+
+    ``workers`` > 1 splits the page range across a process pool; ``None``
+    uses one worker per CPU. Progress is recorded in ``pages/manifest.json``:
+    a re-run on an unchanged PDF with the same settings returns the stored
+    metadata without rendering, and an interrupted run resumes by skipping
+    pages whose outputs are still valid.
+
+    Page metadata is streamed to the page store (``pages/pages.jsonl``, via
+    a ``.tmp`` file that replaces the previous store when the run finishes)
+    as each page range finishes, so memory does not grow with page count.
+    Returns a lazy :class:`page_store.PageStore` over the pages, in page
+    order.
+    """
+    for _ in iter_preprocess_pdf(
+        pdf_path, project_dir, ocr, workers, dpi, zoom_dpi, thumb_width,
+        image_format, quality, ocr_min_chars, ocr_workers, tables,
+    ):
+        pass
+    return PageStore(os.path.join(project_dir, "pages"))
+
+
+def preprocess_batch(
+    pdf_paths: List[str],
+    projects_dir: str,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[Dict], None]] = None,
+    **options,
+) -> List[Dict]:
+    """Preprocess several PDFs into ``projects_dir/<pdf name>`` workspaces.
+
+    Page ranges of all documents are submitted round-robin to one shared
+    process pool, so small reports finish early instead of queueing behind
+    large ones. At most ``IN_FLIGHT_PER_WORKER * workers`` ranges are
+    outstanding at a time, and each range's results are released once
+    written, so memory does not grow with the size of the batch. ``options`` are the keyword options of :func:`preprocess_pdf`.
+    ``progress`` is called with a document's status dict whenever one of its
+    page ranges completes.
+
+    Returns one status dict per PDF with keys ``pdf``, ``project_dir``,
+    ``status`` (``done``, ``up_to_date`` or ``failed``), ``pages``,
+    ``pages_done``, ``seconds`` and ``error``.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    ocr_workers = options.pop("ocr_workers", 2)
+    settings = _settings(**options)
+
+    statuses: List[Dict] = []
+    jobs: List[Tuple[Dict, _DocumentJob]] = []
+    for pdf_path in pdf_paths:
+        name = os.path.splitext(os.path.basename(pdf_path))[0]
+        status = {
+            "pdf": pdf_path,
+            "project_dir": os.path.join(projects_dir, name),
+            "status": "pending",
+            "pages": 0,
+            "pages_done": 0,
+            "seconds": 0.0,
+            "error": "",
+        }
+        statuses.append(status)
+        started = time.perf_counter()
+        try:
+            job = _DocumentJob(pdf_path, status["project_dir"], settings, workers, ocr_workers)
+        except Exception as e:
+            status.update(status="failed", error=str(e))
+            continue
+        status["pages"] = job.page_count
+        if job.up_to_date:
+            status.update(status="up_to_date", pages_done=job.page_count)
+        else:
+            status["started"] = started
+            jobs.append((status, job))
+
+    # Round-robin over documents so every document makes progress early.
+    queue = []
+    remaining: Dict[int, int] = {}
+    for round_tasks in zip_longest(*(job.tasks for _, job in jobs)):
+        for k, task in enumerate(round_tasks):
+            if task is not None:
+                queue.append((k, task))
+    for k, (_, job) in enumerate(jobs):
+        remaining[k] = len(job.tasks)
+
+    def fail(k: int, error: Exception) -> None:
+        status, job = jobs[k]
+        job.abort()
+        status.update(status="failed", error=str(error))
+        status["seconds"] = round(time.perf_counter() - status.pop("started"), 3)
+
+    def complete(k: int) -> None:
+        status, job = jobs[k]
+        try:
+            pages = job.finish()
+        except Exception as e:
+            fail(k, e)
+            return
+        status.update(status="done", pages=len(pages))
+        status["seconds"] = round(time.perf_counter() - status.pop("started"), 3)
+
+    try:
+        for k, count in remaining.items():
+            if count == 0:
+                complete(k)
+
+        if queue:
+            with ProcessPoolExecutor(max_workers=min(workers, len(queue))) as pool:
+                todo = iter(queue)
+                in_flight: Dict[Future, int] = {}
+
+                def submit_next() -> None:
+                    for k, task in todo:
+                        status, job = jobs[k]
+                        if status["status"] != "failed":
+                            job.start()
+                            in_flight[pool.submit(_process_pages, *task)] = k
+                            return
+
+                def collect(k: int, future: Future) -> None:
+                    status, job = jobs[k]
+                    if status["status"] == "failed":
+                        return
+                    try:
+                        results = future.result()
+                        job.add(results)
+                    except Exception as e:
+                        fail(k, e)
+                    else:
+                        status["status"] = "running"
+                        status["pages_done"] += len(results)
+                        remaining[k] -= 1
+                        if remaining[k] == 0:
+                            complete(k)
+                    if progress is not None:
+                        progress(dict(status))
+
+                for _ in range(IN_FLIGHT_PER_WORKER * workers):
+                    submit_next()
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        # Popped futures (and the page records they hold) are
+                        # dropped once collected; only in-flight ones stay alive.
+                        collect(in_flight.pop(future), future)
+                        submit_next()
+    finally:
+        # Interrupted (e.g. KeyboardInterrupt): drop unfinished page stores;
+        # finished ones are already closed and unaffected.
+        for _, job in jobs:
+            job.abort()
+    return statuses
 
 
 def pdf_sha256(pdf_path: str) -> str:
@@ -60,4 +770,3 @@ def pdf_sha256(pdf_path: str) -> str:
         for chunk in iter(lambda: f.read(8192), b""):
             h.update(chunk)
     return h.hexdigest()
-
@@ -3,21 +3,98 @@
 
 import sys
 import os
-from pdf_loader import preprocess_pdf
+from pdf_loader import preprocess_batch, preprocess_pdf
+
+STATUS_LABELS = {'done': '✅ 완료', 'up_to_date': '⏭️  최신', 'failed': '❌ 실패',
+                 'running': '⏳ 진행', 'pending': '… 대기'}
+
+
+def run_batch(data_dir, projects_dir, workers, use_ocr, options):
+    """디렉토리의 모든 PDF를 projects_dir/<PDF 이름>으로 일괄 전처리"""
+    if not os.path.isdir(data_dir):
+        print(f"❌ 오류: {data_dir} 디렉토리가 없습니다.")
+        return 1
+    pdf_files = sorted(f for f in os.listdir(data_dir) if f.lower().endswith('.pdf'))
+    if not pdf_files:
+        print(f"❌ 오류: {data_dir}에 PDF 파일이 없습니다.")
+        return 1
+
+    print("=" * 60)
+    print("PDF 일괄 전처리 시작")
+    print("=" * 60)
+    print(f"입력 디렉토리: {data_dir} ({len(pdf_files)}개 PDF)")
+    print(f"출력 디렉토리: {projects_dir}/<PDF 이름>")
+    print(f"OCR 사용: {'예' if use_ocr else '아니오'}")
+    print(f"워커 수: {workers or f'{os.cpu_count() or 1} (CPU 코어 수)'} (모든 문서가 하나의 워커 풀을 공유)")
+    print("=" * 60)
+
+    def progress(status):
+        name = os.path.basename(status['pdf'])
+        label = STATUS_LABELS.get(status['status'], status['status'])
+        print(f"  {label} {name}: {status['pages_done']}/{status['pages']} 페이지")
+
+    statuses = preprocess_batch([os.path.join(data_dir, f) for f in pdf_files], projects_dir,
+                                workers=workers, progress=progress, ocr=use_ocr, **options)
+
+    print("\n" + "=" * 60)
+    print("📊 일괄 전처리 결과")
+    print("=" * 60)
+    for status in statuses:
+        name = os.path.basename(status['pdf'])
+        label = STATUS_LABELS.get(status['status'], status['status'])
+        line = f"{label}  {name} → {status['project_dir']} ({status['pages']}페이지, {status['seconds']}초)"
+        if status['error']:
+            line += f" - {status['error']}"
+        print(line)
+    failed = [s for s in statuses if s['status'] == 'failed']
+    print(f"\n총 {len(statuses)}개 중 실패 {len(failed)}개")
+    return 1 if failed else 0
+
 
 def main():
     # 인자 파싱
     use_ocr = '--ocr' in sys.argv
+    # None: 단일 PDF는 1개, --batch는 CPU 코어 수만큼
+    workers = None
+    # 이미지 피라미드 설정 (썸네일 / 화면용 dpi / 확대용 zoom_dpi, 0이면 생략) 및 OCR 설정
+    options = {'dpi': 72, 'zoom_dpi': 0, 'thumb_width': 200, 'image_format': 'png', 'quality': 85,
+               'ocr_min_chars': 50, 'ocr_workers': 2, 'tables': False}
 
     # --pdf 옵션 처리
     pdf_path = None
     output_dir = 'new_project'
+    # --batch 옵션 처리 (디렉토리의 모든 PDF)
+    batch_dir = None
+    projects_dir = 'projects'
 
     for i, arg in enumerate(sys.argv):
         if arg == '--pdf' and i + 1 < len(sys.argv):
             pdf_path = sys.argv[i + 1]
         elif arg == '--output_dir' and i + 1 < len(sys.argv):
             output_dir = sys.argv[i + 1]
+        elif arg == '--workers' and i + 1 < len(sys.argv):
+            # 0 이하이면 CPU 코어 수만큼 사용
+            workers = int(sys.argv[i + 1])
+            if workers <= 0:
+                workers = os.cpu_count() or 1
+        elif arg in ('--dpi', '--zoom_dpi', '--thumb_width', '--quality',
+                     '--ocr_min_chars', '--ocr_workers') and i + 1 < len(sys.argv):
+            options[arg[2:]] = int(sys.argv[i + 1])
+        elif arg == '--format' and i + 1 < len(sys.argv):
+            options['image_format'] = sys.argv[i + 1]
+        elif arg == '--tables':
+            # 표 추출 단계 (느림, 기본 생략)
+            options['tables'] = True
+        elif arg == '--batch' and i + 1 < len(sys.argv):
+            batch_dir = sys.argv[i + 1]
+        elif arg == '--projects_dir' and i + 1 < len(sys.argv):
+            projects_dir = sys.argv[i + 1]
+
+    if batch_dir is not None:
+        return run_batch(batch_dir, projects_dir, workers, use_ocr, options)
+
+    if workers is None:
+        workers = 1
 
     # 기존 방식 지원 (첫 번째 인자가 --로 시작하지 않으면 디렉토리로 간주)
     if pdf_path is None and len(sys.argv) > 1 and not sys.argv[1].startswith('--'):
@@ -45,6 +122,8 @@ def main():
         print(f"\n발견된 PDF 파일 ({len(pdf_files)}개):")
         for i, pdf in enumerate(pdf_files, 1):
             print(f"  {i}. {pdf}")
+        if len(pdf_files) > 1:
+            print(f"\n⚠️  첫 번째 PDF만 처리합니다. 모두 처리하려면: --batch {data_dir}")
         print()
 
         # 첫 번째 PDF 파일 선택
@@ -73,19 +152,23 @@ def main():
     print(f"입력 PDF: {pdf_path}")
     print(f"출력 디렉토리: {output_dir}")
     print(f"OCR 사용: {'예' if use_ocr else '아니오'}")
+    print(f"워커 수: {workers}")
+    zoom = f"{options['zoom_dpi']}dpi" if options['zoom_dpi'] else '생략'
+    print(f"이미지: {options['image_format']} (화면 {options['dpi']}dpi, 확대 {zoom}, 썸네일 {options['thumb_width']}px)")
     print("=" * 60)
     print(f"\n처리 중: {os.path.basename(pdf_path)}\n")
 
     # PDF 전처리 실행
     try:
-        preprocess_pdf(pdf_path, output_dir, ocr=use_ocr)
+        preprocess_pdf(pdf_path, output_dir, ocr=use_ocr, workers=workers, **options)
 
         print("\n" + "=" * 60)
         print("✅ PDF 전처리 완료!")
         print("=" * 60)
         print(f"결과 위치: {output_dir}/pages/")
-        print(f"- 페이지 이미지: {output_dir}/pages/*.png")
-        print(f"- 메타데이터: {output_dir}/pages/metadata.json")
+        zoom_dir = ', pages/zoom/' if options['zoom_dpi'] else ''
+        print(f"- 페이지 이미지: {output_dir}/pages/ (화면용), pages/thumb/{zoom_dir}")
+        print(f"- 메타데이터: {output_dir}/pages/pages.jsonl (+ pages.idx)")
         print("\n다음 단계:")
         print("  1. jupyter notebook candidate_miner/heuristic_analysis.ipynb")
         print("  2. cd esg_test && python pyqt5_gui.py")
@@ -11,8 +11,22 @@ def test_heuristic_mining():
     assert res and res[0]["value"] == "2.5"
 
 
+def test_heuristic_matches_normalized_text_once_per_page():
+    from candidate_miner.heuristics import _matched_metrics
+
+    miner = CandidateMiner({})
+    page = {"page": 1, "text": "ＧＨＧ   Emissions\n\ngreenhouse\tgas 2.5 tCO2e"}
+    _matched_metrics.cache_clear()
+    assert miner.heuristic("TC-SC-110a.1", page)
+    assert miner.heuristic("TC-SC-110a.2", page) == []
+    assert miner.heuristic("TC-SC-130a.1", page) == []
+    info = _matched_metrics.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+    assert miner.heuristic("TC-SC-110a.1", {"page": 2, "text": "Scope 1 greenhouse\ngas 3 tCO2e"})
+
+
 def test_llm_mining(monkeypatch):
-    def fake_post(url, json, headers, timeout):
+    def fake_post(self, url, json, headers, timeout):
         class Resp:
             def raise_for_status(self):
                 pass
@@ -31,7 +45,7 @@ def test_llm_mining(monkeypatch):
 
         return Resp()
 
-    monkeypatch.setattr(requests, "post", fake_post)
+    monkeypatch.setattr(requests.Session, "post", fake_post)
     miner = CandidateMiner({"llm_base_url": "http://x", "api_key": "k", "llm_model": "m"})
     metric = {
         "metric_code": "metric",
@@ -42,3 +56,108 @@ def test_llm_mining(monkeypatch):
     }
     res = miner.llm(metric, "text")
     assert res and res[0]["unit_pred"] == "%"
+
+
+def test_heuristic_project_batch(tmp_path):
+    from candidate_miner.batch import load_candidates
+    from page_store import PageStoreWriter
+
+    pages = [
+        {"page": 1, "text": "Greenhouse gas emissions 2.5 tCO2e, 2023"},
+        {"page": 2, "text": "Renewable energy share 40 %"},
+        {"page": 3, "text": "Board meeting 12 times"},
+    ]
+    (tmp_path / "pages").mkdir()
+    with PageStoreWriter(str(tmp_path / "pages")) as writer:
+        for page in pages:
+            writer.write(page)
+    miner = CandidateMiner({})
+    for workers in (1, 2):
+        result = miner.heuristic_project(str(tmp_path), workers=workers)
+        assert result.pages("TC-SC-110a.1") == [1]
+        assert result.pages("TC-SC-110a.2") == [2]
+    loaded = load_candidates(str(tmp_path))
+    for metric_id in loaded.metric_ids:
+        for page in pages:
+            assert loaded.get(metric_id, page["page"]) == miner.heuristic(metric_id, page)
+
+
+def test_heuristic_candidates_get_word_boxes(tmp_path):
+    import fitz
+
+    from pdf_loader import preprocess_pdf
+
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 100), "Greenhouse gas emissions were 2.5 tCO2e", fontsize=11)
+    doc.save(str(tmp_path / "r.pdf"))
+    doc.close()
+    page = preprocess_pdf(str(tmp_path / "r.pdf"), str(tmp_path / "proj"))[0]
+    res = CandidateMiner({}).heuristic("TC-SC-110a.1", page, str(tmp_path / "proj" / "pages"))
+    x0, y0, x1, y1 = res[0]["bbox"]
+    assert 200 < x0 < x1 < 300 and y0 < 100 < y1
+
+
+def _keyword_project(tmp_path, pages):
+    import json
+
+    from page_store import PageStoreWriter
+
+    (tmp_path / "keywords.json").write_text(json.dumps({"pack": "TR-AU"}), encoding="utf-8")
+    (tmp_path / "pages").mkdir()
+    with PageStoreWriter(str(tmp_path / "pages")) as writer:
+        for page in pages:
+            writer.write(page)
+
+
+def test_heuristic_uses_project_keywords_and_ocr(tmp_path):
+    from candidate_miner.batch import load_candidates
+
+    pages = [
+        {"page": 1, "text": "Vehicles sold 12,000", "ocr": "리콜 3건"},
+        {"page": 2, "text": "Greenhouse gas emissions 2.5 tCO2e", "ocr": ""},
+    ]
+    _keyword_project(tmp_path, pages)
+    miner = CandidateMiner({}, str(tmp_path))
+    assert miner.heuristic("TR-AU-250a.2", pages[0])
+    assert miner.heuristic("TC-SC-110a.1", pages[1]) == []
+    miner.heuristic_project(str(tmp_path))
+    loaded = load_candidates(str(tmp_path))
+    for metric_id in loaded.metric_ids:
+        for page in pages:
+            assert loaded.get(metric_id, page["page"]) == miner.heuristic(metric_id, page)
+
+
+def test_stale_candidates_file_is_ignored(tmp_path):
+    import json
+
+    from candidate_miner.batch import load_candidates, mine_project
+
+    _keyword_project(tmp_path, [{"page": 1, "text": "리콜 3건", "ocr": ""}])
+    mine_project(str(tmp_path))
+    assert load_candidates(str(tmp_path)) is not None
+    (tmp_path / "keywords.json").write_text(
+        json.dumps({"pack": "TR-AU", "add": {"TR-AU-250a.1": ["zz-new-keyword"]}}), encoding="utf-8"
+    )
+    assert load_candidates(str(tmp_path)) is None
+    mine_project(str(tmp_path))
+    (tmp_path / "pages" / "manifest.json").write_text(
+        json.dumps({"version": 2, "pdf_sha256": "other", "pages": {}}), encoding="utf-8"
+    )
+    assert load_candidates(str(tmp_path)) is None
+
+
+def test_table_cells_come_first_in_heuristic_and_batch(tmp_path):
+    from candidate_miner.batch import load_candidates, mine_project
+    from pdf_loader import preprocess_pdf
+    from test_page_tables import make_table_pdf
+
+    project = tmp_path / "proj"
+    page = preprocess_pdf(make_table_pdf(tmp_path / "t.pdf"), str(project), tables=True)[0]
+    pages_dir = str(project / "pages")
+    miner = CandidateMiner({})
+    res = miner.heuristic("TC-SC-110a.1", page, pages_dir)
+    assert [(c["value"], c.get("col_header")) for c in res[:2]] == [("1,200", "2022"), ("1,100", "2023")]
+    assert [c["value"] for c in res].count("1,200") == 1
+    mine_project(str(project))
+    assert load_candidates(str(project)).get("TC-SC-110a.1", 1) == res
+    assert [c["value"] for c in miner.combined("TC-SC-110a.1", {}, page, pages_dir)][:2] == ["1,200", "1,100"]
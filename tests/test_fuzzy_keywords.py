@@ -0,0 +1,38 @@
+import random
+
+from candidate_miner.fuzzy_keywords import FuzzyKeywordIndex
+from candidate_miner.keyword_automaton import KeywordAutomaton
+from candidate_miner.page_ranking import bm25_scores
+
+KEYWORDS = {"GHG": ["온실가스", "CO2", "greenhouse gas"], "Water": ["용수 사용량", "water"]}
+
+
+def test_matches_ocr_noise():
+    index = FuzzyKeywordIndex(KEYWORDS, max_distance=1)
+    cases = {
+        "온실가ㅅㅡ 배출": ("온실가ㅅㅡ", 0),  # split syllable
+        "C O 2 emissions": ("C O 2", 0),  # spaced-out letters
+        "total greenhouse gos in 2023": ("greenhouse gos", 1),  # one wrong letter
+        "용수사용랑 감소": ("용수사용랑", 1),  # missing space, one wrong jamo
+    }
+    for text, (span, distance) in cases.items():
+        (match,) = index.find(text)
+        assert (text[match.start : match.end], match.distance) == (span, distance)
+    assert index.find("C02") == []  # short keywords must match exactly
+    assert FuzzyKeywordIndex(KEYWORDS, max_distance=0).find("greenhouse gos") == []
+
+
+def test_finds_everything_exact_matching_finds():
+    rng = random.Random(1)
+    exact = KeywordAutomaton(KEYWORDS)
+    fuzzy = FuzzyKeywordIndex(KEYWORDS)
+    vocabulary = ["온실가스", "용수", "사용량", "water", "CO2", "greenhouse", "gas", "배출", "2023"]
+    for _ in range(100):
+        text = " ".join(rng.choice(vocabulary) for _ in range(8))
+        assert set(exact.metrics_in(text)) <= set(fuzzy.metrics_in(text))
+
+
+def test_drop_in_for_bm25():
+    pages = [{"page": 1, "text": "온실가ㅅㅡ 배출량"}, {"page": 2, "text": "water"}]
+    _, scores = bm25_scores(FuzzyKeywordIndex(KEYWORDS), pages)
+    assert scores[0, 0] > 0 and scores[1, 1] > 0
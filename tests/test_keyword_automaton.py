@@ -0,0 +1,31 @@
+import random
+
+from candidate_miner.keyword_automaton import KeywordAutomaton
+from candidate_miner.page_mapping import map_pages
+
+
+def test_find_reports_every_occurrence_per_metric():
+    automaton = KeywordAutomaton({"GHG": ["온실가스", "가스", "GHG"], "Water": ["water", "용수"]})
+    hits = automaton.find("Scope 1 온실가스 및 ghg, Water 용수")
+    assert hits["GHG"] == [(8, "온실가스"), (10, "가스"), (15, "ghg")]
+    assert [kw for _, kw in hits["Water"]] == ["water", "용수"]
+
+
+def test_matches_naive_substring_search():
+    rng = random.Random(0)
+    alphabet = "ab가나 "
+    keywords = {f"m{i}": ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(3)] for i in range(8)}
+    automaton = KeywordAutomaton(keywords)
+    for _ in range(50):
+        text = "".join(rng.choice(alphabet) for _ in range(40))
+        naive = [m for m, kws in keywords.items() if any(kw.lower() in text.lower() for kw in kws)]
+        assert automaton.metrics_in(text) == naive
+
+
+def test_map_pages_summary():
+    automaton = KeywordAutomaton({"A": ["energy"], "B": ["water"]})
+    pages = [{"page": 1, "text": "Energy use"}, {"page": 2, "text": "nothing"}, {"page": 3, "text": "", "ocr": "water"}]
+    result = map_pages(automaton, pages)
+    assert result["metric_page_mapping"] == {"A": [1], "B": [3]}
+    assert result["excluded_page_list"] == [2]
+    assert result["summary"]["efficiency"] == "66.7%"
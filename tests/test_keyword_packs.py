@@ -0,0 +1,35 @@
+import json
+import os
+
+from candidate_miner.keyword_packs import compile_keywords, project_automaton, project_keywords
+
+PROJECTS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "projects")
+
+
+def write(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def test_project_overrides_apply_to_pack(tmp_path):
+    packs = tmp_path / "packs"
+    packs.mkdir()
+    write(packs / "TC-XX.json", {"industry": "TC-XX", "metric_keywords": {"A": ["energy", "에너지"], "B": ["water"]}})
+    project = tmp_path / "proj"
+    project.mkdir()
+    write(project / "keywords.json", {"pack": "TC-XX", "add": {"A": ["전력"], "C": ["waste"]}, "remove": {"B": ["water"]}})
+    assert project_keywords(str(project), str(packs)) == {"A": ["energy", "에너지", "전력"], "B": [], "C": ["waste"]}
+
+
+def test_compiled_matcher_is_cached_by_content():
+    first = compile_keywords({"A": ["energy"]})
+    assert compile_keywords({"A": ["energy"]}) is first
+    changed = compile_keywords({"A": ["energy", "power"]})
+    assert changed is not first and changed.metrics_in("Power use") == ["A"]
+
+
+def test_repository_projects_use_packs():
+    automaton = project_automaton(os.path.join(PROJECTS, "samsung_2024"))
+    assert automaton.metric_ids[0].startswith("TC-HW")
+    assert project_keywords(os.path.join(PROJECTS, "삼성전기_2024")) == project_keywords(
+        os.path.join(PROJECTS, "samsung_2024")
+    )
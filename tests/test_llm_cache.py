@@ -0,0 +1,38 @@
+import time
+
+from candidate_miner.llm_cache import LLMCache, cache_key
+
+
+def test_cache_key_is_content_addressed():
+    payload = {"input": [{"content": {"metric_code": "A", "page_text": "x"}}]}
+    assert cache_key("m", payload) == cache_key("m", {"input": [{"content": {"page_text": "x", "metric_code": "A"}}]})
+    assert cache_key("m", payload) != cache_key("other", payload)
+    assert cache_key("m", payload) != cache_key("m", {"input": [{"content": {"metric_code": "A", "page_text": "y"}}]})
+
+
+def test_hits_misses_and_persistence(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    with LLMCache(path) as cache:
+        assert cache.get("k") is None
+        cache.put("k", [{"value": "1"}])
+        assert cache.get("k") == [{"value": "1"}]
+        assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+    with LLMCache(path) as cache:
+        assert cache.get("k") == [{"value": "1"}]
+        assert cache.stats()["entries"] == 1
+
+
+def test_eviction_by_age_and_size(tmp_path):
+    with LLMCache(str(tmp_path / "c.sqlite"), max_bytes=100) as cache:
+        for key in "abcd":
+            cache.put(key, [{"text": key * 30}])  # ~45 bytes each
+            time.sleep(0.01)
+        cache.get("a")  # now the most recently used
+        assert cache.evict() == 2
+        assert cache.get("a") and cache.get("d")
+        assert cache.get("b") is None and cache.get("c") is None
+
+        cache.max_age = 0
+        time.sleep(0.01)
+        assert cache.get("a") is None
+        assert cache.evict() == 2 and cache.stats()["entries"] == 0
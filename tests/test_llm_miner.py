@@ -0,0 +1,195 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from candidate_miner import CandidateMiner
+from candidate_miner.llm_miner import llm_configured
+from candidate_miner.prompts import build_batch_candidate_payload, split_batch_candidates
+
+DELAY = 0.2
+
+
+class FakeLLM(BaseHTTPRequestHandler):
+    """Stand-in ``/responses`` endpoint echoing the metric code back."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+    clients = set()
+    requests = 0
+
+    def do_POST(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+            cls.clients.add(self.client_address)
+            cls.requests += 1
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        user = payload["input"][1]["content"]
+        time.sleep(DELAY)
+
+        def candidates(code):
+            return [{"page": user["page_no"], "score": 0.9, "category_pred": "quantitative", "value": code}]
+
+        if "metrics" in user:  # batched prompt
+            reply = {"metrics": [{"metric_code": m["metric_code"], "candidates": candidates(m["metric_code"])}
+                                 for m in user["metrics"]]}
+        else:
+            reply = {"candidates": candidates(user["metric_code"])}
+        body = json.dumps(reply).encode()
+        with cls.lock:
+            cls.active -= 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def llm_server():
+    FakeLLM.active = FakeLLM.peak = 0
+    FakeLLM.clients = set()
+    FakeLLM.requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeLLM)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_llm_many_is_concurrent_and_ordered(llm_server):
+    miner = CandidateMiner({"llm_base_url": llm_server, "api_key": "k", "llm_model": "m", "llm_concurrency": 4})
+    jobs = [({"metric_code": f"M{i}", "page_no": i}, "text") for i in range(12)]
+    start = time.perf_counter()
+    results = miner.llm_many(jobs)
+    elapsed = time.perf_counter() - start
+
+    assert [r[0]["value"] for r in results] == [f"M{i}" for i in range(12)]
+    assert FakeLLM.peak == 4
+    assert elapsed < 12 * DELAY / 2  # 3 rounds of 4, not 12 sequential calls
+    assert miner.llm(*jobs[0]) == results[0]
+
+
+def test_llm_many_without_endpoint_returns_empty_lists():
+    assert CandidateMiner({}).llm_many([({}, "a"), ({}, "b")]) == [[], []]
+    assert CandidateMiner({}).llm_many([]) == []
+
+
+def test_llm_many_inside_running_event_loop(llm_server):
+    miner = CandidateMiner({"llm_base_url": llm_server, "api_key": "k", "llm_model": "m"})
+    jobs = [({"metric_code": f"M{i}", "page_no": i}, "text") for i in range(3)]
+
+    async def notebook_cell():
+        return miner.llm_many(jobs)
+
+    assert [r[0]["value"] for r in asyncio.run(notebook_cell())] == ["M0", "M1", "M2"]
+    miner.close()
+
+
+def test_early_stop_closes_client_after_requests_finish(llm_server, monkeypatch):
+    from candidate_miner.llm_miner import LLMClient, iter_llm_candidates
+
+    active_at_close = []
+    close = LLMClient.close
+
+    def recording_close(self):
+        active_at_close.append(FakeLLM.active)
+        close(self)
+
+    monkeypatch.setattr(LLMClient, "close", recording_close)
+    config = {"llm_base_url": llm_server, "api_key": "k", "llm_model": "m", "llm_concurrency": 4}
+    jobs = [({"metric_code": f"M{i}", "page_no": i}, "text") for i in range(12)]
+
+    async def first():
+        stream = iter_llm_candidates(jobs, config)
+        item = await stream.__anext__()
+        await stream.aclose()
+        return item
+
+    assert asyncio.run(first())[1]
+    assert active_at_close == [0]
+    assert FakeLLM.requests <= 8  # queued requests were dropped
+
+
+def test_miner_reuses_pooled_connections(llm_server):
+    miner = CandidateMiner({"llm_base_url": llm_server, "api_key": "k", "llm_model": "m", "llm_concurrency": 3})
+    for i in range(5):
+        assert miner.llm({"metric_code": f"M{i}", "page_no": i}, "text")
+    miner.llm_many([({"metric_code": f"M{i}", "page_no": i}, "text") for i in range(9)])
+    stats = miner.llm_stats()
+    assert stats["requests"] == 14 and stats["errors"] == 0
+    assert 1 <= stats["connections"] <= 3 == stats["pool_size"]
+    assert len(FakeLLM.clients) == stats["connections"]  # sockets the server actually saw
+    miner.close()
+
+
+def test_project_cache_answers_repeated_requests(llm_server, tmp_path):
+    config = {"llm_base_url": llm_server, "api_key": "k", "llm_model": "m"}
+    metric = {"metric_code": "M1", "page_no": 1}
+    miner = CandidateMiner(config, str(tmp_path))
+    first = miner.llm(metric, "text")
+    assert miner.llm(metric, "text") == first
+    assert miner.llm_many([(metric, "text"), (metric, "other text")])[0] == first
+    stats = miner.llm_stats()
+    assert stats["requests"] == 2
+    assert (stats["cache"]["hits"], stats["cache"]["misses"]) == (2, 2)
+    miner.close()
+
+    # A new session of the same project is served from disk.
+    miner = CandidateMiner(config, str(tmp_path))
+    assert miner.llm(metric, "text") == first
+    assert miner.llm_stats()["requests"] == 0
+    miner.close()
+
+
+def test_cache_is_opened_only_for_llm_use(llm_server, tmp_path):
+    page = {"page": 1, "text": "Greenhouse gas emissions 2.5 tCO2e"}
+    miner = CandidateMiner({}, str(tmp_path))
+    assert miner.heuristic("TC-SC-110a.1", page)
+    assert miner.llm({"metric_code": "M1", "page_no": 1}, "text") == []
+    assert miner.cache is None
+    miner.close()
+    assert list(tmp_path.iterdir()) == []
+
+    miner = CandidateMiner({"llm_base_url": llm_server, "api_key": "k", "llm_model": "m"}, str(tmp_path))
+    assert not (tmp_path / "llm_cache.sqlite").exists()
+    miner.llm({"metric_code": "M1", "page_no": 1}, "text")
+    assert (tmp_path / "llm_cache.sqlite").exists()
+    miner.close()
+
+
+def test_batched_prompt_sends_page_once_and_fans_out(llm_server):
+    config = {"llm_base_url": llm_server, "api_key": "k", "llm_model": "m", "llm_batch_metrics": 4}
+    jobs = [({"metric_code": f"M{i}", "page_no": page}, f"text of page {page}") for page in (1, 2) for i in range(6)]
+    miner = CandidateMiner(config)
+    results = miner.llm_many(jobs)
+    assert [(r[0]["page"], r[0]["value"]) for r in results] == [(m["page_no"], m["metric_code"]) for m, _ in jobs]
+    assert FakeLLM.requests == 4  # two pages x ceil(6 / 4)
+    assert miner.llm_page([jobs[0][0], jobs[1][0]], jobs[0][1]) == [results[0], results[1]]
+
+    payload = build_batch_candidate_payload("m", [m for m, _ in jobs[:6]], jobs[0][1])
+    assert json.dumps(payload).count("text of page 1") == 1
+    miner.close()
+
+
+def test_split_batch_candidates_keeps_metric_order():
+    metrics = [{"metric_code": "A"}, {"metric_code": "B"}, {"metric_code": "C"}]
+    data = {"metrics": [{"metric_code": "B", "candidates": [{"value": "2"}]},
+                        {"metric_code": "A", "candidates": [{"value": "1"}]}]}
+    assert split_batch_candidates(data, metrics) == [[{"value": "1"}], [{"value": "2"}], []]
+
+
+def test_llm_configured_needs_endpoint_key_and_model():
+    assert llm_configured({"llm_base_url": "http://x", "api_key": "k", "llm_model": "m"})
+    assert not llm_configured({"llm_base_url": "http://x", "api_key": "", "llm_model": "m"})
@@ -0,0 +1,72 @@
+import requests
+
+from candidate_miner import CandidateMiner
+from candidate_miner.page_context import SEPARATOR, build_page_context, estimate_tokens
+
+FILLER = "Our company values integrity and innovation across all of its business units. " * 40
+PAGE = FILLER + "Scope 1 greenhouse gas emissions were 1,234 tCO2e in 2023. " + FILLER + "Board met 12 times."
+
+
+def test_short_page_is_kept_whole():
+    context = build_page_context("GHG emissions 5 tCO2e", ["GHG"], 100)
+    assert context.text == "GHG emissions 5 tCO2e"
+    assert context.dropped_ratio == 0 and context.number_recall == 1
+
+
+def test_keeps_keyword_and_number_windows_under_budget():
+    context = build_page_context(PAGE, ["greenhouse gas"], 120, window=80)
+    assert estimate_tokens(context.text) <= 120
+    assert "greenhouse gas emissions were 1,234 tCO2e" in context.text
+    assert "Board met 12 times" in context.text  # a number window fits in the leftover budget
+    assert SEPARATOR in context.text
+    assert context.dropped_ratio > 0.8
+    assert (context.numbers_kept, context.numbers_total) == (4, 4)  # 1, 1,234, 2023, 12
+
+
+def test_without_anchors_keeps_the_head():
+    context = build_page_context(FILLER, ["greenhouse gas"], 50)
+    assert FILLER.startswith(context.text) and 0 < estimate_tokens(context.text) <= 50
+
+
+def _capture_page_text(monkeypatch):
+    sent = []
+
+    def fake_post(self, url, json, headers, timeout):
+        sent.append(json["input"][1]["content"]["page_text"])
+
+        class Resp:
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"candidates": []}
+
+        return Resp()
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+    return sent
+
+
+CONFIG = {"llm_base_url": "http://x", "api_key": "k", "llm_model": "m", "llm_context_tokens": 150, "llm_cache": False}
+
+
+def test_llm_prompt_uses_windowed_text(monkeypatch):
+    sent = _capture_page_text(monkeypatch)
+    miner = CandidateMiner(CONFIG)
+    miner.llm({"metric_code": "TC-SC-110a.1", "page_no": 1}, PAGE)
+    assert "1,234 tCO2e" in sent[0] and len(sent[0]) < len(PAGE) / 5
+    assert miner.llm_stats()["context_dropped_ratio"] > 0.8
+
+
+def test_llm_prompt_windows_around_project_pack_keywords(monkeypatch, tmp_path):
+    (tmp_path / "keywords.json").write_text('{"pack": "TR-AU"}', encoding="utf-8")
+    numbers = "".join(f"Line {i} shipped {i * 37} units. " for i in range(1, 60))
+    page = numbers + FILLER + "차량 리콜 시정조치 내역을 공개합니다. " + FILLER
+    sent = _capture_page_text(monkeypatch)
+    miner = CandidateMiner(CONFIG, str(tmp_path))
+    miner.llm({"metric_code": "TR-AU-250a.2", "page_no": 1}, page)
+    miner.llm_page([{"metric_code": "TR-AU-250a.2", "page_no": 1}, {"metric_code": "TR-AU-310a.1", "page_no": 1}], page)
+    miner.llm_many([({"metric_code": "TR-AU-250a.2", "page_no": 1}, page)])
+    assert len(sent) == 3
+    for text in sent:
+        assert "리콜 시정조치 내역" in text and len(text) < len(page) / 5
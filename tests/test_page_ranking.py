@@ -0,0 +1,58 @@
+import math
+
+import numpy as np
+
+from candidate_miner.keyword_automaton import KeywordAutomaton
+from candidate_miner.page_mapping import rank_page_mapping
+from candidate_miner.page_ranking import BM25_B, BM25_K1, bm25_scores, rank_pages
+
+KEYWORDS = {"GHG": ["온실가스", "scope 1", "ghg"], "Water": ["water", "용수"], "Shared": ["ghg", "water"]}
+PAGES = [
+    {"page": 1, "text": "GHG ghg 온실가스 Scope 1 emissions"},
+    {"page": 2, "text": "water use and ghg", "ocr": "용수 재이용"},
+    {"page": 3, "text": "Board of directors"},
+    {"page": 4, "text": "온실가스 " * 3 + "long filler text " * 20},
+]
+
+
+def naive_bm25(keywords, pages):
+    texts = [(p["text"] + "\n" + p.get("ocr", "")).lower() for p in pages]
+    lengths = [len("".join(t.split())) for t in texts]
+    avgdl = sum(lengths) / len(lengths)
+    scores = {}
+    for metric, kws in keywords.items():
+        for i, text in enumerate(texts):
+            s = 0.0
+            for kw in kws:
+                tf = text.count(kw)
+                if not tf:
+                    continue
+                df = sum(kw in t for t in texts)
+                idf = math.log(1 + (len(texts) - df + 0.5) / (df + 0.5))
+                s += idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * lengths[i] / avgdl))
+            scores[metric, pages[i]["page"]] = s
+    return scores
+
+
+def test_bm25_matches_naive_scores():
+    automaton = KeywordAutomaton(KEYWORDS)
+    page_numbers, scores = bm25_scores(automaton, PAGES)
+    expected = naive_bm25(KEYWORDS, PAGES)
+    for j, metric in enumerate(automaton.metric_ids):
+        for i, page in enumerate(page_numbers):
+            assert np.isclose(scores[i, j], expected[metric, page])
+
+
+def test_rank_pages_orders_by_score_and_cuts_top_k():
+    ranked = rank_pages(KeywordAutomaton(KEYWORDS), PAGES, top_k=2)
+    assert [page for page, _ in ranked["GHG"]] == [1, 2]
+    assert [page for page, _ in ranked["Water"]] == [2]
+    assert all(page != 3 for hits in ranked.values() for page, _ in hits)
+
+
+def test_rank_page_mapping_document():
+    result = rank_page_mapping(KeywordAutomaton(KEYWORDS), PAGES, top_k=1)
+    assert result["metric_page_mapping"] == {"GHG": [1], "Water": [2], "Shared": [2]}
+    assert result["excluded_page_list"] == [3, 4]
+    assert result["metric_page_scores"]["Water"][0]["page"] == 2
+    assert result["summary"]["top_k"] == 1
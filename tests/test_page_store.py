@@ -0,0 +1,37 @@
+import json
+
+from page_store import PageStore, PageStoreWriter, best_image, open_page_store
+
+
+def test_out_of_order_writes_read_by_page(tmp_path):
+    with PageStoreWriter(str(tmp_path)) as writer:
+        for page in (2, 3, 1):
+            writer.write({"page": page, "text": f"page {page} 온실가스"})
+    store = PageStore(str(tmp_path))
+    assert len(store) == 3
+    assert store.page(3)["text"] == "page 3 온실가스"
+    assert store[0]["page"] == 1
+    assert [r["page"] for r in store] == [1, 2, 3]
+    assert store.page(4) is None
+
+
+def test_open_page_store_reads_legacy_metadata(tmp_path):
+    pages = [{"page": 1, "text": "a"}, {"page": 2, "text": "b"}]
+    (tmp_path / "metadata.json").write_text(json.dumps(pages))
+    assert open_page_store(str(tmp_path))[1]["text"] == "b"
+
+
+def test_best_image_picks_smallest_level_filling_box(tmp_path):
+    record = {
+        "image_path": "proj/pages/1.png",
+        "images": {
+            "thumb": {"path": "thumb/1.png", "width": 200, "height": 283},
+            "screen": {"path": "1.png", "width": 595, "height": 842},
+            "zoom": {"path": "zoom/1.png", "width": 1190, "height": 1684},
+        },
+    }
+    assert best_image(record, "pages", 150, 150).endswith("thumb/1.png")
+    assert best_image(record, "pages", 780, 580).endswith("pages/1.png")
+    assert best_image(record, "pages", 1200, 1600).endswith("zoom/1.png")
+    assert best_image(record, "pages", 5000, 5000).endswith("zoom/1.png")
+    assert best_image({"image_path": "proj/pages/3.png"}, "pages", 10, 10) == "pages/3.png"
@@ -0,0 +1,56 @@
+import fitz
+
+from candidate_miner.heuristics import table_candidates
+from page_tables import _table_cells, find_cells, load_tables
+from pdf_loader import preprocess_pdf
+
+
+def make_table_pdf(path):
+    rows = [["Item", "2022", "2023"], ["GHG emissions (tCO2e)", "1,200", "1,100"], ["Water (m3)", "50", "45"]]
+    doc = fitz.open()
+    page = doc.new_page()
+    widths = [200, 80, 80]
+    for r, row in enumerate(rows):
+        x = 50
+        for c, text in enumerate(row):
+            rect = fitz.Rect(x, 100 + 30 * r, x + widths[c], 130 + 30 * r)
+            page.draw_rect(rect, color=(0, 0, 0), width=0.8)
+            page.insert_text((rect.x0 + 4, rect.y1 - 10), text, fontsize=10)
+            x += widths[c]
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def test_headers_fill_merged_cells():
+    grid = [
+        ["Site", "Emissions (tCO2e)", None, None],
+        [None, "Scope 1", "Scope 2", "Total"],
+        ["Plant A", "1,000", "2,000", "3,000"],
+        [None, "10", "20", "30"],
+    ]
+    boxes = [[(c, r, c + 1, r + 1) for c in range(4)] for r in range(4)]
+    result = _table_cells(grid, boxes)
+    assert result["header_rows"] == 2
+    cell = next(c for c in result["cells"] if c["row"] == 3 and c["col"] == 2)
+    assert cell["value"] == 20.0
+    assert cell["unit"] == "tCO2e"
+    assert cell["row_header"] == "Plant A"
+    assert cell["col_header"] == "Emissions (tCO2e) / Scope 2"
+    assert cell["bbox"] == [2, 3, 3, 4]
+    assert [c["value"] for c in find_cells([result], ["plant a"], "scope 1")] == [1000.0, 10.0]
+
+
+def test_preprocess_extracts_tables(tmp_path):
+    pdf = make_table_pdf(tmp_path / "table.pdf")
+    project = tmp_path / "proj"
+    page = preprocess_pdf(pdf, str(project), tables=True)[0]
+    pages_dir = str(project / "pages")
+    assert page["table_count"] == 1
+    table = load_tables(page, pages_dir)[0]
+    assert (table["rows"], table["cols"]) == (3, 3)
+    candidates = table_candidates(["ghg"], page, pages_dir, year="2023")
+    assert [(c["value"], c["unit"]) for c in candidates] == [("1,100", "tCO2e")]
+    x0, y0, x1, y1 = candidates[0]["bbox"]
+    assert (x0, y0) == (330, 130) and (x1, y1) == (410, 160)
+    assert preprocess_pdf(pdf, str(project))[0]["tables"] is None
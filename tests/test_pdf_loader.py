@@ -0,0 +1,241 @@
+import json
+
+import fitz
+
+import pdf_loader
+from page_store import load_layout, open_page_store
+from pdf_loader import (
+    page_ranges,
+    iter_preprocess_pdf,
+    load_manifest,
+    preprocess_batch,
+    preprocess_pdf,
+)
+from word_geometry import load_words
+
+
+def make_pdf(path, n_pages=5):
+    doc = fitz.open()
+    for i in range(1, n_pages + 1):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i} emissions 2.{i} tCO2e")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def test_page_ranges_cover_all_pages():
+    ranges = page_ranges(10, 2)
+    assert ranges[0][0] == 0 and ranges[-1][1] == 10
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+
+
+def test_preprocess_parallel_matches_serial(tmp_path):
+    pdf = make_pdf(tmp_path / "report.pdf")
+    serial = preprocess_pdf(pdf, str(tmp_path / "serial"))
+    parallel = preprocess_pdf(pdf, str(tmp_path / "parallel"), workers=2)
+    assert [m["page"] for m in parallel] == [1, 2, 3, 4, 5]
+    assert [m["text"] for m in parallel] == [m["text"] for m in serial]
+    assert (tmp_path / "parallel" / "pages" / "5.png").exists()
+
+
+def test_rerun_skips_valid_pages(tmp_path):
+    pdf = make_pdf(tmp_path / "report.pdf")
+    project = tmp_path / "proj"
+    first = list(preprocess_pdf(pdf, str(project)))
+    png = project / "pages" / "3.png"
+    mtime = png.stat().st_mtime_ns
+    assert list(preprocess_pdf(pdf, str(project))) == first
+    assert png.stat().st_mtime_ns == mtime
+
+
+def test_resume_rerenders_only_missing_pages(tmp_path):
+    pdf = make_pdf(tmp_path / "report.pdf")
+    project = tmp_path / "proj"
+    preprocess_pdf(pdf, str(project))
+    manifest = load_manifest(str(project / "pages"))
+    manifest["complete"] = False
+    (project / "pages" / "manifest.json").write_text(json.dumps(manifest))
+    (project / "pages" / "2.png").unlink()
+    kept = (project / "pages" / "4.png").stat().st_mtime_ns
+
+    meta = preprocess_pdf(pdf, str(project))
+    assert len(meta) == 5
+    assert (project / "pages" / "2.png").exists()
+    assert (project / "pages" / "4.png").stat().st_mtime_ns == kept
+    assert load_manifest(str(project / "pages"))["complete"]
+
+
+def test_image_pyramid_levels(tmp_path):
+    pdf = make_pdf(tmp_path / "report.pdf", n_pages=1)
+    project = tmp_path / "proj"
+    page = preprocess_pdf(pdf, str(project), dpi=72, zoom_dpi=144, image_format="webp")[0]
+    images = page["images"]
+    assert images["zoom"]["width"] == 2 * images["screen"]["width"]
+    assert images["thumb"]["width"] == 200
+    for level in images.values():
+        assert (project / "pages" / level["path"]).exists()
+    assert page["image_path"].endswith("1.webp")
+    assert page["word_count"] == 5
+    assert (project / "pages" / page["words"]).exists()
+
+
+def test_zoom_level_is_opt_in(tmp_path):
+    pdf = make_pdf(tmp_path / "report.pdf", n_pages=1)
+    page = preprocess_pdf(pdf, str(tmp_path / "proj"), dpi=100)[0]
+    assert set(page["images"]) == {"thumb", "screen"}
+    assert not (tmp_path / "proj" / "pages" / "zoom").exists()
+    # The screen level is rendered at its own dpi, not downscaled from a larger raster.
+    assert abs(page["images"]["screen"]["width"] - page["page_size"][0] * 100 / 72) <= 1
+
+
+def test_ocr_only_text_poor_pages(tmp_path, monkeypatch):
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Scope 1 greenhouse gas emissions were 1,234 tCO2e in 2023 " * 2)
+    doc.new_page()  # image-only / blank page
+    pdf = str(tmp_path / "mixed.pdf")
+    doc.save(pdf)
+    calls = []
+
+    class FakeTesseract:
+        @staticmethod
+        def image_to_string(img):
+            calls.append(img.size)
+            return "scanned text"
+
+    monkeypatch.setattr(pdf_loader, "pytesseract", FakeTesseract)
+    pages = list(preprocess_pdf(pdf, str(tmp_path / "proj"), ocr=True))
+    assert [p["ocr"] for p in pages] == ["", "scanned text"]
+    assert len(calls) == 1
+
+    # Same page image on another project run is served from the cache.
+    (tmp_path / "proj" / "pages" / "manifest.json").unlink()
+    preprocess_pdf(pdf, str(tmp_path / "proj"), ocr=True)
+    assert len(calls) == 1
+
+
+def test_failed_ocr_is_retried(tmp_path, monkeypatch):
+    doc = fitz.open()
+    doc.new_page()  # image-only page
+    pdf = str(tmp_path / "scan.pdf")
+    doc.save(pdf)
+    project = tmp_path / "proj"
+
+    class BrokenTesseract:
+        @staticmethod
+        def image_to_string(img):
+            raise RuntimeError("tesseract is not installed")
+
+    monkeypatch.setattr(pdf_loader, "pytesseract", BrokenTesseract)
+    assert [p["ocr"] for p in preprocess_pdf(pdf, str(project), ocr=True)] == [""]
+    manifest = load_manifest(str(project / "pages"))
+    assert not manifest["complete"] and "ocr" not in manifest["pages"]["1"]
+
+    class FakeTesseract:
+        @staticmethod
+        def image_to_string(img):
+            return "scanned text"
+
+    monkeypatch.setattr(pdf_loader, "pytesseract", FakeTesseract)
+    assert [p["ocr"] for p in preprocess_pdf(pdf, str(project), ocr=True)] == ["scanned text"]
+    assert load_manifest(str(project / "pages"))["complete"]
+    # A settings change that keeps the renders still re-OCRs nothing once it succeeded.
+    assert [p["ocr"] for p in preprocess_pdf(pdf, str(project), ocr=True, ocr_min_chars=10)] == ["scanned text"]
+
+
+def test_preprocess_batch_shared_pool(tmp_path):
+    pdfs = [make_pdf(tmp_path / "a.pdf", 3), make_pdf(tmp_path / "b.pdf", 6)]
+    seen = []
+    statuses = preprocess_batch(pdfs, str(tmp_path / "projects"), workers=2, progress=seen.append)
+    assert [(s["status"], s["pages"]) for s in statuses] == [("done", 3), ("done", 6)]
+    assert (tmp_path / "projects" / "b" / "pages" / "pages.jsonl").exists()
+    assert {s["pdf"] for s in seen} == set(pdfs)
+
+    again = preprocess_batch(pdfs, str(tmp_path / "projects"), workers=2)
+    assert [s["status"] for s in again] == ["up_to_date", "up_to_date"]
+
+
+def test_preprocess_batch_reports_failed_finish(tmp_path, monkeypatch):
+    pdfs = [make_pdf(tmp_path / "a.pdf", 2), make_pdf(tmp_path / "b.pdf", 2)]
+    build = pdf_loader.build_text_index
+
+    def build_text_index(pages_dir):
+        if "/a/" in pages_dir + "/":
+            raise OSError("disk full")
+        return build(pages_dir)
+
+    monkeypatch.setattr(pdf_loader, "build_text_index", build_text_index)
+    statuses = preprocess_batch(pdfs, str(tmp_path / "projects"), workers=1)
+    assert [(s["status"], s["error"]) for s in statuses] == [("failed", "disk full"), ("done", "")]
+
+
+def test_preprocess_batch_aborts_open_stores_on_interrupt(tmp_path, monkeypatch):
+    pdfs = [make_pdf(tmp_path / "a.pdf", 2), make_pdf(tmp_path / "b.pdf", 2)]
+
+    def interrupt(status):
+        raise KeyboardInterrupt
+
+    try:
+        preprocess_batch(pdfs, str(tmp_path / "projects"), workers=1, progress=interrupt)
+    except KeyboardInterrupt:
+        pass
+    assert list((tmp_path / "projects").glob("*/pages/pages.jsonl*")) == []
+
+
+def test_iter_preprocess_streams_pages_and_resumes(tmp_path):
+    pdf = make_pdf(tmp_path / "report.pdf", 5)
+    project = tmp_path / "proj"
+    gen = iter_preprocess_pdf(pdf, str(project))
+    first = next(gen)
+    assert first["page"] == 1
+    # The first page is available before the last one is rendered.
+    assert not (project / "pages" / "5.png").exists()
+    gen.close()
+    assert not load_manifest(str(project / "pages"))["complete"]
+
+    pages = [m["page"] for m in iter_preprocess_pdf(pdf, str(project))]
+    assert pages == [1, 2, 3, 4, 5]
+    assert [m["page"] for m in iter_preprocess_pdf(pdf, str(project))] == pages
+
+
+def test_rerun_keeps_previous_store_readable(tmp_path):
+    pdf = make_pdf(tmp_path / "report.pdf", 5)
+    project = tmp_path / "proj"
+    preprocess_pdf(pdf, str(project))
+    gen = iter_preprocess_pdf(pdf, str(project), dpi=100)
+    next(gen)
+    assert [m["page"] for m in open_page_store(str(project / "pages"))] == [1, 2, 3, 4, 5]
+    gen.close()
+    assert [m["page"] for m in open_page_store(str(project / "pages"))] == [1, 2, 3, 4, 5]
+    assert not (project / "pages" / "pages.jsonl.tmp").exists()
+
+
+def test_layout_shares_block_numbers_with_words(tmp_path):
+    pdf = make_pdf(tmp_path / "report.pdf", n_pages=1)
+    project = tmp_path / "proj"
+    page = preprocess_pdf(pdf, str(project))[0]
+    layout = load_layout(page, str(project / "pages"))
+    assert layout["reading_order"] == [b["number"] for b in layout["blocks"]]
+    assert layout["blocks"][0]["lines"][0]["text"].startswith("Page 1 emissions")
+    words = load_words(str(project / "pages"), 1)
+    assert set(words.block.tolist()) == {layout["blocks"][0]["number"]}
+
+
+def test_parallel_ranges_are_submitted_in_a_bounded_window(tmp_path, monkeypatch):
+    from concurrent.futures import ProcessPoolExecutor
+
+    submitted, consumed = [], []
+    real_submit = ProcessPoolExecutor.submit
+
+    def submit(self, fn, *args):
+        submitted.append(args[2])
+        return real_submit(self, fn, *args)
+
+    monkeypatch.setattr(ProcessPoolExecutor, "submit", submit)
+    monkeypatch.setattr(pdf_loader, "MAX_CHUNK_PAGES", 1)
+    pdf = make_pdf(tmp_path / "report.pdf", n_pages=12)
+    for page in pdf_loader.iter_preprocess_pdf(pdf, str(tmp_path / "proj"), workers=2):
+        consumed.append(page["page"])
+        # Never more than 2 x workers ranges ahead of the consumer.
+        assert len(submitted) - len(consumed) <= pdf_loader.IN_FLIGHT_PER_WORKER * 2
+    assert consumed == list(range(1, 13))
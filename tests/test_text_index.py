@@ -0,0 +1,63 @@
+import numpy as np
+
+from page_store import PageStoreWriter
+from text_index import INDEX_NAME, TextIndex, load_text_index
+
+PAGES = [
+    {"page": 1, "text": "Scope 1 GHG emissions\n본보고서는 온실가스 배출량을 공개합니다", "ocr": ""},
+    {"page": 2, "text": "Total energy consumed", "ocr": "온실 가스 배출량 1,234 tCO2e"},
+    {"page": 3, "text": "scope 2 ghg Emissions and scope 1", "ocr": ""},
+]
+
+
+def test_term_and_phrase_queries():
+    index = TextIndex.build(PAGES)
+    assert [p for p, _ in index.term("GHG")] == [1, 3]
+    assert index.phrase("scope 1 ghg") == [(1, 0)]
+    assert [p for p, _ in index.phrase("ghg emissions")] == [1, 3]
+    assert index.phrase("emissions scope") == []
+
+
+def test_substring_matches_run_together_korean():
+    index = TextIndex.build(PAGES)
+    text = PAGES[0]["text"].lower()
+    assert index.substring("보고서") == [(1, text.index("보고서"))]
+    assert index.pages_with("배출량") == [1, 2]
+    assert index.pages_with("온실가스") == [1]
+    assert index.pages_with("온실 가스") == [2]
+    assert index.pages_with("없는말") == []
+
+
+def test_substring_single_characters_and_whitespace():
+    index = TextIndex.build([{"page": 1, "text": "5 % up"}, {"page": 2, "text": "끝%"}, {"page": 3, "text": "온실X가스"}])
+    assert index.pages_with("%") == [1, 2]
+    assert index.substring("5") == [(1, 0)]
+    assert index.substring("% up") == [(1, 2)]
+    assert index.pages_with("온실 가스") == []
+    assert index.pages_with("온실X가스") == [3]
+    assert index.pages_with("   ") == []
+
+
+def test_old_index_files_are_rebuilt(tmp_path):
+    with PageStoreWriter(str(tmp_path)) as writer:
+        for record in PAGES:
+            writer.write(record)
+    load_text_index(str(tmp_path))
+    with np.load(tmp_path / INDEX_NAME) as data:
+        arrays = {name: data[name] for name in data.files if name != "version"}
+    np.savez_compressed(tmp_path / INDEX_NAME, **arrays)
+    assert load_text_index(str(tmp_path)).pages_with("가스") == [1, 2]
+    with np.load(tmp_path / INDEX_NAME) as data:
+        assert "version" in data.files
+
+
+def test_saved_index_round_trips(tmp_path):
+    with PageStoreWriter(str(tmp_path)) as writer:
+        for record in PAGES:
+            writer.write(record)
+    assert not (tmp_path / INDEX_NAME).exists()
+    built = load_text_index(str(tmp_path))
+    assert (tmp_path / INDEX_NAME).exists()
+    loaded = load_text_index(str(tmp_path))
+    for query in ("tco2e", "가스 배출량", "scope"):
+        assert loaded.substring(query) == built.substring(query)
@@ -1,5 +1,12 @@
 import os
-from utils import find_numbers_and_units, text_has_synonym, write_json, read_json
+from utils import (
+    extract_numbers,
+    find_numbers_and_units,
+    normalize_text,
+    page_view,
+    read_json,
+    write_json,
+)
 
 
 def test_find_numbers_and_units():
@@ -9,9 +16,40 @@ def test_find_numbers_and_units():
     assert ("96.8", "%") in [(v, u) for v, u, _ in results]
 
 
-def test_text_has_synonym():
-    assert text_has_synonym("TC-SC-110a.1", "The company reports greenhouse gas emissions")
-    assert not text_has_synonym("TC-SC-110a.1", "No related keywords here")
+def test_extract_numbers_single_scan():
+    text = "배출량은2,500톤, 임직원 1,234명의 사고 3건 / Scope 1: 12.5 kWh, CO2 5,000백만원 20 GJ"
+    tokens = extract_numbers(text)
+    assert [(t.number, t.value, t.unit) for t in tokens] == [
+        ("2,500", 2500.0, "톤"),
+        ("1,234", 1234.0, "명"),
+        ("3", 3.0, "건"),
+        ("1", 1.0, ""),
+        ("12.5", 12.5, "kWh"),
+        ("5,000", 5000.0, "백만원"),
+        ("20", 20.0, "GJ"),
+    ]
+    assert text[tokens[0].start : tokens[0].end] == "2,500"
+
+
+def test_unit_does_not_bind_to_next_number():
+    assert [(v, u) for v, u, _ in find_numbers_and_units("2021 2022 3.5 tons")] == [
+        ("2021", ""),
+        ("2022", ""),
+        ("3.5", "tons"),
+    ]
+
+
+def test_normalize_text_and_cached_page_view():
+    text = "ＧＨＧ   Emissions\n\ngreenhouse\tgas 2.5 tCO2e"
+    assert normalize_text(text) == "ghg emissions greenhouse gas 2.5 tco2e"
+    assert normalize_text("\u1112\u1161\u11ab") == "한"
+    assert normalize_text("ㄱㅏ") == "가"
+    assert normalize_text("가ㅅ") == "가\u1109"
+    page_view.cache_clear()
+    assert page_view(text).text == normalize_text(text)
+    assert page_view(text).numbers[0].unit == "tCO2e"
+    info = page_view.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
 
 
 def test_read_write_json(tmp_path):
@@ -0,0 +1,37 @@
+from word_geometry import load_words, write_words
+
+
+def test_roundtrip_and_spatial_lookup(tmp_path):
+    words = [
+        (10, 10, 50, 20, "온실가스", 0, 0, 0),
+        (60, 10, 90, 20, "1,234", 0, 0, 1),
+        (10, 300, 40, 310, "tCO2e", 1, 0, 0),
+    ]
+    assert write_words(str(tmp_path), 1, words) == 3
+    pw = load_words(str(tmp_path), 1)
+    assert len(pw) == 3
+    assert pw.texts() == ["온실가스", "1,234", "tCO2e"]
+    assert list(pw.in_rect(0, 0, 100, 50)) == [0, 1]
+    assert list(pw.find("tCO2e")) == [2]
+    assert pw.boxes()[1].tolist() == [60, 10, 90, 20]
+    assert list(pw.block) == [0, 0, 1]
+
+
+def test_missing_page_returns_none(tmp_path):
+    assert load_words(str(tmp_path), 7) is None
+
+
+def test_char_span_maps_to_word_boxes(tmp_path):
+    text = "온실가스 1,234\ntCO2e"
+    words = [
+        (10, 10, 50, 20, "온실가스", 0, 0, 0),
+        (60, 10, 90, 20, "1,234", 0, 0, 1),
+        (10, 300, 40, 310, "tCO2e", 1, 0, 0),
+    ]
+    write_words(str(tmp_path), 1, words, text)
+    pw = load_words(str(tmp_path), 1)
+    assert list(pw.char_start) == [0, 5, 11]
+    assert pw.span_bbox(5, 10) == [60, 10, 90, 20]
+    assert pw.span_bbox(6, 8) == [60, 10, 90, 20]
+    assert pw.span_bbox(2, 7) == [10, 10, 90, 20]
+    assert pw.span_bbox(4, 5) is None
@@ -0,0 +1,183 @@
+"""Positional inverted index over a project's page text.
+
+Two posting lists are kept, both over the lowercased page text (text layer
+plus OCR):
+
+* terms - ``\\w+`` tokens -> ``(page, token position, char offset)``, for
+  term and phrase queries;
+* grams - every non-whitespace character and every two-character window
+  without whitespace -> ``(page, char offset)``, for substring queries.
+  Korean reports often run words together ("본보고서는KG모빌리티의"), so
+  substrings are the useful query there. Gram postings narrow the query to
+  candidate pages, which are then checked against the stored page text.
+
+The index is stored as ``pages/text_index.npz`` (NumPy arrays: UTF-8 key and
+page text blobs, CSR-style pointers and uint32 postings).
+"""
+from __future__ import annotations
+
+import os
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from page_store import open_page_store, page_text
+
+INDEX_NAME = "text_index.npz"
+# Bump when the stored arrays change; older files are rebuilt on load.
+INDEX_VERSION = 2
+TOKEN_RE = re.compile(r"\w+")
+
+
+def _pack_keys(keys: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    blob = bytearray()
+    offsets = [0]
+    for key in keys:
+        blob += key.encode("utf-8")
+        offsets.append(len(blob))
+    return np.frombuffer(bytes(blob), dtype=np.uint8), np.asarray(offsets, dtype=np.uint64)
+
+
+def _unpack_keys(blob: np.ndarray, offsets: np.ndarray) -> Dict[str, int]:
+    data = blob.tobytes()
+    return {data[offsets[i] : offsets[i + 1]].decode("utf-8"): i for i in range(len(offsets) - 1)}
+
+
+def _combine(page: np.ndarray, value: np.ndarray) -> np.ndarray:
+    """Pack ``(page, value)`` pairs into one int64 for set operations."""
+    return (page.astype(np.int64) << 32) | (value.astype(np.int64) & 0xFFFFFFFF)
+
+
+class TextIndex:
+    """Query interface; build with :meth:`build` or :func:`load_text_index`."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self._a = arrays
+        self._terms = _unpack_keys(arrays["term_keys"], arrays["term_key_ptr"])
+        self._grams = _unpack_keys(arrays["gram_keys"], arrays["gram_key_ptr"])
+        self._pages = {int(page): i for i, page in enumerate(arrays["text_pages"])}
+
+    @classmethod
+    def build(cls, pages: Iterable[Dict]) -> "TextIndex":
+        terms: Dict[str, List[Tuple[int, int, int]]] = defaultdict(list)
+        grams: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        texts: Dict[int, str] = {}
+        for record in pages:
+            page = record["page"]
+            text = texts[page] = page_text(record).lower()
+            for pos, m in enumerate(TOKEN_RE.finditer(text)):
+                terms[m.group()].append((page, pos, m.start()))
+            for i, ch in enumerate(text):
+                if ch.isspace():
+                    continue
+                grams[ch].append((page, i))
+                if i + 1 < len(text) and not text[i + 1].isspace():
+                    grams[text[i : i + 2]].append((page, i))
+
+        arrays: Dict[str, np.ndarray] = {"version": np.asarray(INDEX_VERSION)}
+        text_pages = sorted(texts)
+        arrays["text_pages"] = np.asarray(text_pages, dtype=np.uint32)
+        arrays["text_blob"], arrays["text_ptr"] = _pack_keys([texts[p] for p in text_pages])
+        for name, table, width in (("term", terms, 3), ("gram", grams, 2)):
+            keys = sorted(table)
+            postings = np.zeros((sum(len(table[k]) for k in keys), width), dtype=np.uint32)
+            ptr = np.zeros(len(keys) + 1, dtype=np.uint64)
+            n = 0
+            for i, key in enumerate(keys):
+                rows = table[key]
+                postings[n : n + len(rows)] = rows
+                n += len(rows)
+                ptr[i + 1] = n
+            arrays[f"{name}_keys"], arrays[f"{name}_key_ptr"] = _pack_keys(keys)
+            arrays[f"{name}_ptr"] = ptr
+            arrays[f"{name}_postings"] = postings
+        return cls(arrays)
+
+    def save(self, path: str) -> None:
+        np.savez_compressed(path, **self._a)
+
+    def _postings(self, name: str, index: Optional[int]) -> np.ndarray:
+        width = 3 if name == "term" else 2
+        if index is None:
+            return np.zeros((0, width), dtype=np.uint32)
+        ptr = self._a[f"{name}_ptr"]
+        return self._a[f"{name}_postings"][int(ptr[index]) : int(ptr[index + 1])]
+
+    def term(self, term: str) -> List[Tuple[int, int]]:
+        """``(page, char offset)`` of every occurrence of the token ``term``."""
+        rows = self._postings("term", self._terms.get(term.lower()))
+        return [(int(p), int(o)) for p, _, o in rows]
+
+    def phrase(self, phrase: str) -> List[Tuple[int, int]]:
+        """``(page, char offset)`` where the tokens of ``phrase`` occur consecutively."""
+        tokens = TOKEN_RE.findall(phrase.lower())
+        if not tokens:
+            return []
+        first = self._postings("term", self._terms.get(tokens[0]))
+        keys = _combine(first[:, 0], first[:, 1])
+        mask = np.ones(len(first), dtype=bool)
+        for k, token in enumerate(tokens[1:], start=1):
+            rows = self._postings("term", self._terms.get(token))
+            mask &= np.isin(keys, _combine(rows[:, 0], rows[:, 1].astype(np.int64) - k))
+        return [(int(p), int(o)) for p, _, o in first[mask]]
+
+    def _text(self, page: int) -> str:
+        i = self._pages[page]
+        ptr = self._a["text_ptr"]
+        return self._a["text_blob"][int(ptr[i]) : int(ptr[i + 1])].tobytes().decode("utf-8")
+
+    def _segment_pages(self, segment: str) -> np.ndarray:
+        """Pages where every gram of ``segment`` sits at its relative offset."""
+        if len(segment) == 1:
+            return np.unique(self._postings("gram", self._grams.get(segment))[:, 0])
+        parts = [(i, segment[i : i + 2]) for i in range(len(segment) - 1)]
+        postings = [(r, self._postings("gram", self._grams.get(g))) for r, g in parts]
+        postings.sort(key=lambda item: len(item[1]))
+        r0, base = postings[0]
+        keys = _combine(base[:, 0], base[:, 1].astype(np.int64) - r0)
+        mask = np.ones(len(keys), dtype=bool)
+        for r, rows in postings[1:]:
+            mask &= np.isin(keys, _combine(rows[:, 0], rows[:, 1].astype(np.int64) - r))
+        return np.unique(base[mask, 0])
+
+    def substring(self, query: str) -> List[Tuple[int, int]]:
+        """``(page, char offset)`` of ``query`` anywhere in the text.
+
+        Whitespace in ``query`` matches any whitespace run in the text; the
+        other characters must match exactly.
+        """
+        segments = query.lower().split()
+        if not segments:
+            return []
+        pages = self._segment_pages(segments[0])
+        for segment in segments[1:]:
+            if not len(pages):
+                break
+            pages = np.intersect1d(pages, self._segment_pages(segment))
+        pattern = re.compile(r"\s+".join(map(re.escape, segments)))
+        return [(int(page), m.start()) for page in pages for m in pattern.finditer(self._text(int(page)))]
+
+    def pages_with(self, query: str) -> List[int]:
+        """Sorted page numbers containing ``query`` as a substring."""
+        return sorted({page for page, _ in self.substring(query)})
+
+
+def build_text_index(pages_dir: str) -> TextIndex:
+    """Build the index from the project's page store and save it."""
+    index = TextIndex.build(open_page_store(pages_dir))
+    index.save(os.path.join(pages_dir, INDEX_NAME))
+    return index
+
+
+def load_text_index(pages_dir: str) -> TextIndex:
+    """Load the saved index, building it first for projects that lack one."""
+    path = os.path.join(pages_dir, INDEX_NAME)
+    if not os.path.exists(path):
+        return build_text_index(pages_dir)
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    if "version" not in arrays or int(arrays["version"]) != INDEX_VERSION:
+        return build_text_index(pages_dir)
+    return TextIndex(arrays)
@@ -7,7 +7,9 @@ import tkinter as tk
 from PIL import Image, ImageTk
 
 from candidate_miner import CandidateMiner
+from candidate_miner.batch import load_candidates
 from annotation.store import AnnotationStore
+from page_store import best_image
 
 
 class AnnotationApp:
@@ -15,7 +17,10 @@ class AnnotationApp:
         self.project_dir = project_dir
         self.pages_meta = pages_meta
         self.store = AnnotationStore(project_dir)
-        self.miner = CandidateMiner(config or {})
+        self.miner = CandidateMiner(config or {}, project_dir)
+        # Precomputed by `python -m candidate_miner.batch` (None if missing or stale);
+        # otherwise mined per click with the same project keywords.
+        self.candidates = load_candidates(project_dir)
 
         self.root = tk.Tk()
         self.root.title("ESG Annotation Tool")
@@ -40,6 +45,8 @@ class AnnotationApp:
         self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
         self.current_boxes = []
+        # The box filled in from the selected candidate (also in current_boxes).
+        self.candidate_box = None
         self.current_rect = None
 
         # Right panel for evidence
@@ -49,8 +56,13 @@ class AnnotationApp:
         
         tk.Label(self.panel, text="주석 패널", bg="lightblue").pack(pady=5)
 
-        self.candidate_list = tk.Listbox(self.panel, height=8)
+        self.candidate_list = tk.Listbox(self.panel, height=8, exportselection=False)
         self.candidate_list.pack(fill=tk.X)
+        self.candidate_list.bind("<<ListboxSelect>>", self.on_candidate_select)
+        self.shown_candidates = []
+        # PDF points -> canvas pixels of the displayed page image
+        self.image_scale = 1.0
+        self.image_offset = (0, 0)
 
         self.value_var = tk.StringVar()
         tk.Label(self.panel, text="Value").pack(anchor="w")
@@ -116,11 +128,12 @@ class AnnotationApp:
         self.page_var.set(number)
         self.page_label.config(text=str(number))
         meta = self.pages_meta[number - 1]
-        print(f"Loading image: {meta['image_path']}")
+        # Use fixed size instead of winfo methods
+        max_width, max_height = 780, 580
+        image_path = best_image(meta, os.path.join(self.project_dir, "pages"), max_width, max_height)
+        print(f"Loading image: {image_path}")
         try:
-            img = Image.open(meta["image_path"])
-            # Use fixed size instead of winfo methods
-            max_width, max_height = 780, 580
+            img = Image.open(image_path)
             img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
             self.photo = ImageTk.PhotoImage(img)
             self.canvas.delete("all")
@@ -131,11 +144,15 @@ class AnnotationApp:
             x = (800 - img_width) // 2
             y = (600 - img_height) // 2
             self.canvas.create_image(x, y, image=self.photo, anchor="nw")
+            page_width = meta.get("page_size", [meta.get("width") or img_width])[0]
+            self.image_scale = img_width / page_width
+            self.image_offset = (x, y)
             print(f"Image displayed at ({x}, {y}), size: {img.size}")
             self.canvas.update()
         except Exception as e:
             print(f"Error loading image: {e}")
         self.current_boxes = []
+        self.candidate_box = None
 
     def on_metric_select(self, event):
         metric_id = self.selected_metric()
@@ -143,14 +160,46 @@ class AnnotationApp:
             return
         self.candidate_list.delete(0, tk.END)
         page_meta = self.pages_meta[self.page_var.get() - 1]
-        for cand in self.miner.heuristic(metric_id, page_meta):
+        if self.candidates is not None:
+            candidates = self.candidates.get(metric_id, page_meta["page"])
+        else:
+            candidates = self.miner.heuristic(metric_id, page_meta, os.path.join(self.project_dir, "pages"))
+        self.shown_candidates = candidates
+        self.canvas.delete("candidate")
+        for cand in candidates:
             self.candidate_list.insert(tk.END, f"{cand['value']} {cand['unit']}")
+            if cand.get("bbox"):
+                self.canvas.create_rectangle(*self._canvas_box(cand["bbox"]), outline="orange", tags="candidate")
         data = self.store.load(metric_id)
         if data["annotations"]:
             ann = data["annotations"][-1]
             self.value_var.set(ann.get("value", ""))
             self.unit_var.set(ann.get("unit", ""))
 
+    def _canvas_box(self, bbox):
+        """PDF-space ``[x0, y0, x1, y1]`` -> canvas coordinates."""
+        ox, oy = self.image_offset
+        x0, y0, x1, y1 = (v * self.image_scale for v in bbox)
+        return [int(x0 + ox), int(y0 + oy), int(x1 + ox), int(y1 + oy)]
+
+    def on_candidate_select(self, event):
+        """Fill value, unit and box from a candidate so saving is one click."""
+        sel = self.candidate_list.curselection()
+        if not sel or sel[0] >= len(self.shown_candidates):
+            return
+        cand = self.shown_candidates[sel[0]]
+        self.value_var.set(cand["value"])
+        self.unit_var.set(cand["unit"])
+        # Replace the previous candidate's box only; boxes drawn by hand stay.
+        self.current_boxes = [box for box in self.current_boxes if box is not self.candidate_box]
+        self.candidate_box = None
+        self.canvas.delete("selected")
+        if cand.get("bbox"):
+            x1, y1, x2, y2 = self._canvas_box(cand["bbox"])
+            self.candidate_box = {"x1": x1, "y1": y1, "x2": x2, "y2": y2}
+            self.current_boxes.append(self.candidate_box)
+            self.canvas.create_rectangle(x1, y1, x2, y2, outline="red", width=2, tags="selected")
+
     def selected_metric(self):
         sel = self.metric_list.curselection()
         if not sel:
@@ -173,6 +222,7 @@ class AnnotationApp:
         }
         self.store.add_annotation(metric, ann)
         self.current_boxes = []
+        self.candidate_box = None
 
     def run(self):
         self.root.mainloop()
@@ -4,12 +4,25 @@ from __future__ import annotations
 import json
 import os
 import re
+import unicodedata
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
-
-# Regex patterns for numbers and common ESG units
-NUMBER_RE = re.compile(r"\b\d[\d,\.]*\b")
-UNIT_RE = re.compile(r"%(?!\w)|tCO2e|GJ|m³|m3|tons?|tonnes?|kg|kWh|MWh", re.IGNORECASE)
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+# Regex patterns for numbers and common ESG units. Numbers may directly follow
+# Hangul ("배출량은2,500톤") but not Latin letters or digits ("CO2", "Scope1").
+NUMBER_RE = re.compile(r"(?<![A-Za-z\d.,])(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?")
+# Longest alternatives first; Latin units must not run into a longer word,
+# Korean units may be followed by particles ("10명의", "5건을").
+UNIT_RE = re.compile(
+    r"(?:%p?|tCO2eq|tCO2e|tCO2|GJ|TJ|MJ|GWh|MWh|kWh|m³|m3|tonnes?|tons?|kg)(?![A-Za-z\d])"
+    r"|백만원|천원|억원|천톤|톤|명|건",
+    re.IGNORECASE,
+)
+# One scan for a number and the unit right after it (optionally one space).
+NUMBER_UNIT_RE = re.compile(
+    rf"(?P<number>{NUMBER_RE.pattern})(?:[ \u00a0]?(?P<unit>{UNIT_RE.pattern}))?", re.IGNORECASE
+)
 
 # Example metric synonym table. In practice this should be loaded from a file
 # but keeping a small dictionary keeps the tool lightweight.
@@ -20,22 +33,60 @@ METRIC_SYNONYMS: Dict[str, List[str]] = {
 }
 
 
+class NumberToken(NamedTuple):
+    """A number found in text, with the unit written right after it."""
+
+    number: str
+    value: float
+    unit: str
+    start: int
+    end: int  # end of the number; the unit follows it
+
+
+def extract_numbers(text: str) -> List[NumberToken]:
+    """Return every number in ``text`` with its unit, in one regex scan."""
+    return [
+        NumberToken(
+            m.group("number"),
+            float(m.group("number").replace(",", "")),
+            m.group("unit") or "",
+            m.start(),
+            m.end("number"),
+        )
+        for m in NUMBER_UNIT_RE.finditer(text)
+    ]
+
+
 def find_numbers_and_units(text: str) -> List[Tuple[str, str, Tuple[int, int]]]:
     """Return list of tuples: (number, unit, span)."""
-    results: List[Tuple[str, str, Tuple[int, int]]] = []
-    for m in NUMBER_RE.finditer(text):
-        span = m.span()
-        snippet = text[span[0] : span[1] + 20]
-        unit_match = UNIT_RE.search(snippet)
-        unit = unit_match.group(0) if unit_match else ""
-        results.append((m.group(0), unit, span))
-    return results
-
-
-def text_has_synonym(metric_id: str, text: str) -> bool:
-    syns = METRIC_SYNONYMS.get(metric_id, [])
-    lowered = text.lower()
-    return any(s in lowered for s in syns)
+    return [(t.number, t.unit, (t.start, t.end)) for t in extract_numbers(text)]
+
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """NFKC-normalize, lowercase and collapse whitespace runs to one space.
+
+    NFKC also folds full-width Latin ("ＧＨＧ") and composes conjoining
+    Hangul jamo into syllables. Compatibility jamo compose only as initial
+    consonant + vowel ("ㄱㅏ" -> "가"); a trailing consonant ("가ㅅ") stays a
+    separate initial jamo instead of becoming "갓".
+    """
+    return WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text).lower()).strip()
+
+
+class PageView(NamedTuple):
+    """Per-page data shared by every metric checked against the page."""
+
+    text: str  # normalize_text() of the page text
+    numbers: Tuple[NumberToken, ...]  # offsets refer to the original text
+
+
+@lru_cache(maxsize=256)
+def page_view(text: str) -> PageView:
+    """Normalize ``text`` and scan its numbers once; cached per page text."""
+    return PageView(normalize_text(text), tuple(extract_numbers(text)))
 
 
 def ensure_dir(path: str) -> None:
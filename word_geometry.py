@@ -0,0 +1,160 @@
+"""Columnar per-page word geometry stored as memory-mappable NumPy arrays.
+
+For every page preprocessing writes ``pages/words/<n>.npy``, a structured
+array with one row per word (PDF-space box, block/line/word numbers, the
+word's slice of the string table and its character span in the page
+``text``), and ``pages/words/<n>.txt``, the UTF-8 string table holding all
+words back to back. Loading memory-maps the array, so spatial queries run as
+vectorized comparisons without materializing millions of small Python
+tuples, and a character span of the page text (e.g. a regex match) maps to
+word boxes by binary search (:meth:`PageWords.span_bbox`).
+"""
+from __future__ import annotations
+
+import os
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from utils import ensure_dir
+
+WORDS_DIR = "words"
+
+WORD_DTYPE = np.dtype(
+    [
+        ("x0", "<f4"),
+        ("y0", "<f4"),
+        ("x1", "<f4"),
+        ("y1", "<f4"),
+        ("block", "<i4"),
+        ("line", "<i4"),
+        ("word", "<i4"),
+        ("str_offset", "<u4"),
+        ("str_len", "<u4"),
+        ("char_start", "<u4"),
+        ("char_end", "<u4"),
+    ]
+)
+
+
+def words_paths(pages_dir: str, page: int) -> tuple:
+    """Return ``(array path, string table path)`` of ``page``."""
+    base = os.path.join(pages_dir, WORDS_DIR, str(page))
+    return base + ".npy", base + ".txt"
+
+
+def write_words(pages_dir: str, page: int, words: Sequence[tuple], text: str = "") -> int:
+    """Store the output of ``page.get_text("words")`` for ``page``.
+
+    ``text`` is the page's ``get_text("text")`` from the same TextPage; words
+    appear in it in the same order, so each word's character span is found
+    by a forward search. Words not found get an empty span.
+
+    Returns the number of words written.
+    """
+    ensure_dir(os.path.join(pages_dir, WORDS_DIR))
+    arr = np.zeros(len(words), dtype=WORD_DTYPE)
+    table = bytearray()
+    pos = 0
+    for k, (x0, y0, x1, y1, word_text, block, line, word) in enumerate(words):
+        encoded = word_text.encode("utf-8")
+        start = text.find(word_text, pos)
+        if start < 0:
+            start = end = pos
+        else:
+            end = pos = start + len(word_text)
+        arr[k] = (x0, y0, x1, y1, block, line, word, len(table), len(encoded), start, end)
+        table += encoded
+    npy_path, txt_path = words_paths(pages_dir, page)
+    np.save(npy_path, arr, allow_pickle=False)
+    with open(txt_path, "wb") as f:
+        f.write(table)
+    return len(words)
+
+
+class PageWords:
+    """Word geometry of one page.
+
+    ``arrays`` is the (memory-mapped) structured array; individual columns
+    are available as attributes, e.g. ``words.x0``.
+    """
+
+    def __init__(self, arrays: np.ndarray, table: bytes):
+        self.arrays = arrays
+        self._table = table
+
+    def __len__(self) -> int:
+        return len(self.arrays)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        if name in WORD_DTYPE.names:
+            return self.arrays[name]
+        raise AttributeError(name)
+
+    def text(self, index: int) -> str:
+        row = self.arrays[index]
+        start = int(row["str_offset"])
+        return self._table[start : start + int(row["str_len"])].decode("utf-8")
+
+    def texts(self, indices: Optional[Iterable[int]] = None) -> List[str]:
+        if indices is None:
+            indices = range(len(self))
+        return [self.text(int(i)) for i in indices]
+
+    def boxes(self, indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return an ``(n, 4)`` float array of ``x0, y0, x1, y1``."""
+        rows = self.arrays if indices is None else self.arrays[indices]
+        return np.stack([rows["x0"], rows["y0"], rows["x1"], rows["y1"]], axis=1)
+
+    def in_rect(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """Indices of words whose box intersects the rectangle."""
+        a = self.arrays
+        mask = (a["x0"] < x1) & (a["x1"] > x0) & (a["y0"] < y1) & (a["y1"] > y0)
+        return np.nonzero(mask)[0]
+
+    def in_span(self, start: int, end: int) -> np.ndarray:
+        """Indices of words overlapping characters ``[start, end)`` of the page text.
+
+        Word spans are sorted and disjoint, so this is two binary searches.
+        """
+        lo = int(np.searchsorted(self.arrays["char_end"], start, side="right"))
+        hi = int(np.searchsorted(self.arrays["char_start"], end, side="left"))
+        return np.arange(lo, max(lo, hi))
+
+    def span_bbox(self, start: int, end: int) -> Optional[List[float]]:
+        """Union box ``[x0, y0, x1, y1]`` of the words covering a text span."""
+        indices = self.in_span(start, end)
+        indices = indices[self.arrays["char_end"][indices] > self.arrays["char_start"][indices]]
+        if not len(indices):
+            return None
+        rows = self.arrays[indices]
+        return [
+            round(float(rows["x0"].min()), 2),
+            round(float(rows["y0"].min()), 2),
+            round(float(rows["x1"].max()), 2),
+            round(float(rows["y1"].max()), 2),
+        ]
+
+    def find(self, word: str) -> np.ndarray:
+        """Indices of words equal to ``word``."""
+        needle = word.encode("utf-8")
+        hits = []
+        start = self._table.find(needle)
+        offsets = self.arrays["str_offset"]
+        while start != -1:
+            k = int(np.searchsorted(offsets, start))
+            if k < len(self) and offsets[k] == start and self.arrays["str_len"][k] == len(needle):
+                hits.append(k)
+            start = self._table.find(needle, start + 1)
+        return np.asarray(hits, dtype=np.int64)
+
+
+def load_words(pages_dir: str, page: int, mmap: bool = True) -> Optional[PageWords]:
+    """Load the word geometry of ``page`` (``None`` if not extracted)."""
+    npy_path, txt_path = words_paths(pages_dir, page)
+    if not os.path.exists(npy_path):
+        return None
+    arrays = np.load(npy_path, mmap_mode="r" if mmap else None, allow_pickle=False)
+    with open(txt_path, "rb") as f:
+        table = f.read()
+    return PageWords(arrays, table)